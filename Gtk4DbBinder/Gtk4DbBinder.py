@@ -23,7 +23,7 @@ import pathlib
 import gi
 gi.require_version( "Gtk" , "4.0" )
 from gi.repository import Gtk, Gio, Gdk, Pango, GObject, GLib
-import json , uuid , importlib.util , sys , re , time , datetime , sqlite3
+import json , hashlib , sys , re , time , datetime , sqlite3 , collections , threading , numbers , weakref
 
 # Define some 'constants'
 # These are the names of icons we render for the relevant record statuses
@@ -34,6 +34,39 @@ DELETED   = "list-remove"
 LOCKED    = "security-high"
 EMPTY     = "window-close"
 
+# Limits for the number of records we fetch + add to a model in 1 go, and how long we'd like each batch to take
+MODEL_BATCH_MIN = 256
+MODEL_BATCH_MAX = 65536
+MODEL_BATCH_TARGET_SECONDS = 0.05
+
+# What _db_begin_transaction() did, so _db_end_transaction() knows how to finish. If we started the transaction,
+# we commit or roll it back. If the caller's transaction was already open, we only use a savepoint inside it,
+# and committing is up to them
+TRANSACTION_STARTED = "started"
+TRANSACTION_SAVEPOINT = "savepoint"
+SAVEPOINT_NAME = "gtk4dbbinder_apply"
+
+# Limits for multi-row insert statements ( see _db_bulk_insert() ), and key lists ( see _build_key_in_filter() )
+BULK_INSERT_MAX_ROWS = 1000
+BULK_INSERT_MAX_PARAMETERS = 30000
+KEY_IN_MAX_KEYS = 1000
+
+# How many DML templates we keep compiled, across all binders ( see Gtk4DbAbstract.compiled_statement() )
+COMPILED_STATEMENTS_MAX = 512
+
+# The GType a GridRow property is declared with, and the Python type values are stored as, for each kind
+# of column. See Gtk4DbAbstract.column_kind(). Values for 'str' columns are stored as the DB driver gives them
+GRID_ROW_KINDS = {
+    'str':   ( str , None )
+  , 'int':   ( GObject.TYPE_INT64 , int )
+  , 'float': ( GObject.TYPE_DOUBLE , float )
+  , 'bool':  ( GObject.TYPE_BOOLEAN , bool )
+}
+
+# Typed columns also get a TYPE_PYOBJECT property with this suffix, holding the native value ( None for NULL ).
+# See native_grid_row_property()
+NATIVE_PROPERTY_SUFFIX = "_native"
+
 class GridWidget( Gtk.Widget ):
 
     def __init__( self , column_name="oops" , **kwargs ):
@@ -85,25 +118,38 @@ class GridProgressBar( Gtk.ProgressBar , GridWidget ):
 class ForeignKeyBinder( GObject.Object ):
     __gtype_name__ = 'ForeignKeyBinder'
 
-    def __init__( self , keys_list , mapping , parent_friendly_table_name ):
+    def __init__( self , keys_list , mapping , parent_friendly_table_name , requery_delay=None , prefetch_neighbours=0 ):
 
         super().__init__()
         self._keys_list = keys_list
-        self._keys_dict_json = '{}'
+        self._keys = None # a tuple of the parent's key values, in keys_list order
         self.mapping = mapping
         self.parent_friendly_table_name = parent_friendly_table_name
+        self.requery_delay = requery_delay # ms the parent's keys must be stable for, before the child requeries
+        self.child_binder = None # the binder that created us, and requeries when we change
+        self.parent_binder = None # the binder whose records we track
+        self.prefetch_neighbours = prefetch_neighbours # the parent fetches children for this many records either side
         for key in keys_list:
             setattr( self , key , None )
 
-    @GObject.Property( type=str )
-    def keys_dict_json( self ):
-        return self._keys_dict_json
+    @GObject.Property( type=GObject.TYPE_PYOBJECT )
+    def keys( self ):
+        return self._keys
+
+    @keys.setter
+    def keys( self , keys ):
+        if self._keys != keys:
+            self._keys = keys
+            self.notify( "keys" )
+
+    def keys_dict( self ):
+        if self._keys is None:
+            return {}
+        return dict( zip( self._keys_list , self._keys ) )
 
-    @keys_dict_json.setter
-    def keys_dict_json( self , keys_dict_json ):
-        if self._keys_dict_json != keys_dict_json:
-            self._keys_dict_json = keys_dict_json
-            self.notify( "keys_dict_json" )
+    def populated( self ):
+        # False until the parent is on a record with at least 1 key value
+        return self._keys is not None and any( value is not None for value in self._keys )
 
 
 class KeyValueModel ( GObject.Object ):
@@ -126,6 +172,767 @@ class KeyValueModel ( GObject.Object ):
         return self._value
 
 
+class IndexedKeyValueModel( GObject.Object , Gio.ListModel ):
+    __gtype_name__ = 'IndexedKeyValueModel'
+
+    """Wraps a Gio.ListStore of KeyValueModel items for DropDown widgets, and keeps key => position
+       and value => key maps up to date as the store changes, so lookups don't have to scan the store.
+       Keys are matched on their string form, as the values in our GridRows often come back as strings"""
+
+    def __init__( self , store=None ):
+
+        super().__init__()
+        self.store = store if store is not None else Gio.ListStore( item_type = KeyValueModel )
+        self.key_to_position = {}
+        self.value_to_key = {}
+        self.indexed_count = 0
+        self.index_stale = True
+        self.store.connect( 'items-changed' , self.on_store_items_changed )
+
+    def do_get_item_type( self ):
+
+        return KeyValueModel.__gtype__
+
+    def do_get_n_items( self ):
+
+        return self.store.get_n_items()
+
+    def do_get_item( self , position ):
+
+        return self.store.get_item( position )
+
+    def append( self , item ):
+
+        self.store.append( item )
+
+    def splice( self , position , n_removals , additions ):
+
+        self.store.splice( position , n_removals , additions )
+
+    def on_store_items_changed( self , store , position , removed , added ):
+
+        if not self.index_stale and removed == 0 and position == self.indexed_count:
+            # Appending is by far the most common change - index just the new items
+            self.index_items( position , position + added )
+        else:
+            # Anything else shifts positions around. We rebuild the next time we're asked for something
+            self.index_stale = True
+        self.items_changed( position , removed , added )
+
+    def index_items( self , start , end ):
+
+        for position in range( start , end ):
+            item = self.store.get_item( position )
+            # 1st match wins, same as the linear scans we replaced
+            self.key_to_position.setdefault( str( item.key ) , position )
+            self.value_to_key.setdefault( item.value , item.key )
+        self.indexed_count = end
+
+    def ensure_index( self ):
+
+        if self.index_stale:
+            self.key_to_position = {}
+            self.value_to_key = {}
+            self.index_items( 0 , self.store.get_n_items() )
+            self.index_stale = False
+
+    def position_of_key( self , key ):
+
+        self.ensure_index()
+        return self.key_to_position.get( str( key ) )
+
+    def value_of_key( self , key ):
+
+        position = self.position_of_key( key )
+        if position is None:
+            return None
+        return self.store.get_item( position ).value
+
+    def key_of_value( self , value ):
+
+        """Returns a ( found , key ) tuple, as None is a perfectly good key"""
+
+        self.ensure_index()
+        if value in self.value_to_key:
+            return True , self.value_to_key[ value ]
+        return False , None
+
+
+class DropDownModelCache:
+
+    """A process-wide cache of drop-down models, keyed by ( connection , sql , bind_values ), and shared by every
+       Form and Datasheet. Lookup queries then run once per session, instead of on every requery.
+       Entries live until invalidate() is called, or until they're older than their ttl ( in seconds ), if one
+       is set. Stale entries are reloaded into the *same* model, so widgets already using it pick up the changes"""
+
+    entries = {}
+    default_ttl = None
+
+    @classmethod
+    def get( cls , connection , sql , bind_values , loader , ttl=None ):
+
+        if ttl is None:
+            ttl = cls.default_ttl
+        key = ( id( connection ) , sql , repr( bind_values ) )
+        entry = cls.entries.get( key )
+
+        if entry is None:
+            # We hold a reference to the connection, so its id() can't be recycled while we're cached
+            entry = { 'connection': connection , 'model': IndexedKeyValueModel() , 'loaded': None }
+            cls.entries[ key ] = entry
+
+        if entry['loaded'] is None or ( ttl is not None and time.time() - entry['loaded'] > ttl ):
+            model = entry['model']
+            model.splice( 0 , len( model ) , loader( sql , bind_values ) )
+            entry['loaded'] = time.time()
+
+        return entry['model']
+
+    @classmethod
+    def invalidate( cls , connection=None , sql=None ):
+
+        """Marks matching entries ( or everything, if called without arguments ) to be reloaded on next use"""
+
+        for key , entry in cls.entries.items():
+            if ( connection is None or entry['connection'] is connection ) and ( sql is None or key[1] == sql ):
+                entry['loaded'] = None
+
+    @classmethod
+    def clear( cls ):
+
+        cls.entries = {}
+
+
+class RequeryScheduler:
+
+    """Collects the child requeries caused by parent records changing, and runs them from an idle handler.
+       Everything scheduled during 1 main-loop iteration is requeried exactly once, parents before children,
+       so in a customer -> orders -> order_lines tree, order_lines only requeries for the orders record it ends up
+       on, and not also for the 1 it was on when the customer changed. Requeries are started 1 after another on
+       the main thread. Only Datasheets with async_query ( which fetch on a worker connection ) return before their
+       records arrive, so only siblings like that end up querying concurrently - everything else runs in turn.
+       Binders are held weakly, so a pending requery doesn't keep a destroyed binder alive"""
+
+    pending = weakref.WeakKeyDictionary() # binder => the ForeignKeyBinder it requeries from
+    source_id = None
+
+    @classmethod
+    def schedule( cls , binder , foreign_key_binder ):
+
+        cls.pending[ binder ] = foreign_key_binder
+        if not cls.source_id:
+            cls.source_id = GLib.idle_add( cls.run )
+
+    @classmethod
+    def cancel( cls , binder ):
+
+        cls.pending.pop( binder , None )
+
+    @classmethod
+    def depth( cls , binder ):
+
+        # How many parents up the binder graph is the binder from its root
+        depth = 0
+        foreign_key_binder = binder.foreign_key_binder
+        while foreign_key_binder and foreign_key_binder.parent_binder:
+            depth = depth + 1
+            foreign_key_binder = foreign_key_binder.parent_binder.foreign_key_binder
+        return depth
+
+    @classmethod
+    def run( cls ):
+
+        # Requerying a binder moves it to a new record, which can schedule its children. They're deeper, so they
+        # get picked up later in this same loop, and anything that was already pending for them is replaced
+        # A failing binder mustn't stop the rest of the tree from requerying
+        try:
+            while cls.pending:
+                binder = min( list( cls.pending.keys() ) , key = cls.depth )
+                foreign_key_binder = cls.pending.pop( binder )
+                try:
+                    binder.requery_from_parent( foreign_key_binder )
+                except Exception as e:
+                    print( "Requery of {0} from its parent failed: {1}".format( binder.friendly_table_name , e ) )
+        finally:
+            cls.source_id = None
+        return False
+
+
+class ChildResultCache:
+
+    """An LRU of child result sets, keyed by the parent keys they were fetched for. Used by child binders
+       ( see Gtk4DbDatasheet's child_cache_size ), so flipping back to a parent record we've already visited
+       doesn't have to hit the database. Trimmed to max_entries, and to budget ( bytes, estimated )"""
+
+    ENTRY_OVERHEAD = 1024
+
+    def __init__( self , max_entries , budget ):
+
+        self.max_entries = max_entries
+        self.budget = budget
+        self.entries = collections.OrderedDict() # parent key => entry dict, oldest 1st
+        self.total_bytes = 0
+        self.generation = 0 # bumped by every invalidation, so results fetched before one can be discarded
+
+    def get( self , parent_key , signature ):
+
+        """Returns the cached entry for parent_key, or None. The query signature has to match too,
+           in case the child's sql has been changed since the entry was stored"""
+
+        entry = self.entries.get( parent_key )
+        if entry is None or entry['signature'] != signature:
+            return None
+        self.entries.move_to_end( parent_key )
+        return entry
+
+    def has( self , parent_key , signature ):
+
+        # Like get(), but without counting as a use
+        entry = self.entries.get( parent_key )
+        return entry is not None and entry['signature'] == signature
+
+    def put( self , parent_key , signature , fieldlist , column_info , records ):
+
+        self.discard( parent_key )
+        size = self.ENTRY_OVERHEAD
+        if records:
+            sample = records[0]
+            size = size + len( records ) * ( sys.getsizeof( sample ) + sum( sys.getsizeof( v ) for v in sample ) )
+        if size > self.budget:
+            return
+        self.entries[ parent_key ] = {
+            'signature': signature , 'fieldlist': fieldlist , 'column_info': column_info , 'records': records , 'bytes': size
+        }
+        self.total_bytes = self.total_bytes + size
+        while len( self.entries ) > self.max_entries or self.total_bytes > self.budget:
+            key , entry = self.entries.popitem( last=False )
+            self.total_bytes = self.total_bytes - entry['bytes']
+
+    def invalidate( self , parent_key ):
+
+        self.generation = self.generation + 1
+        self.discard( parent_key )
+
+    def discard( self , parent_key ):
+
+        entry = self.entries.pop( parent_key , None )
+        if entry:
+            self.total_bytes = self.total_bytes - entry['bytes']
+
+    def clear( self ):
+
+        self.generation = self.generation + 1
+        self.entries.clear()
+        self.total_bytes = 0
+
+
+class TableSchema:
+
+    """Everything we know about a table from the database catalog: primary keys, and each column's declared type,
+       nullability and default. Schemas are loaded once, and shared by every Form and Datasheet bound to the same
+       table on the same connection. If use_cache_file() has been called, schemas for binders with a
+       schema_cache_key are also persisted, so a cold start doesn't have to hit the catalog at all"""
+
+    registry = {} # ( connection key , table ) => TableSchema
+    cache_file = None
+
+    def __init__( self , table , primary_keys , columns ):
+
+        self.table = table
+        self.primary_keys = primary_keys
+        self.columns = columns # a list of dicts: { 'name' , 'type' , 'nullable' , 'default' }
+        self.connection = None # the connection we were loaded from, if we're keyed by its id()
+        self.name_to_index = {}
+        for index , column in enumerate( columns ):
+            self.name_to_index.setdefault( column['name'].upper() , index )
+
+    def column( self , name ):
+
+        index = self.name_to_index.get( name.upper() )
+        return None if index is None else self.columns[ index ]
+
+    def to_dict( self ):
+
+        return { 'table': self.table , 'primary_keys': self.primary_keys , 'columns': self.columns }
+
+    @classmethod
+    def from_dict( cls , d ):
+
+        return cls( d['table'] , d['primary_keys'] , d['columns'] )
+
+    @classmethod
+    def get( cls , binder , table ):
+
+        key = ( binder.schema_registry_key() , table )
+        schema = cls.registry.get( key )
+        if schema is not None and schema.connection is not None and schema.connection is not binder.connection:
+            schema = None # an id() we've seen before, but a different connection
+        if schema is None:
+            schema = cls( table , binder.primary_key_info( None , None , table ) , binder.table_column_info( table ) )
+            if not isinstance( key[0] , str ):
+                # We hold a reference to the connection, so its id() can't be recycled while we're registered
+                schema.connection = binder.connection
+            cls.registry[ key ] = schema
+            if cls.cache_file and isinstance( key[0] , str ):
+                cls.save_cache_file( cls.cache_file )
+        return schema
+
+    @classmethod
+    def invalidate( cls , connection_key=None , table=None ):
+
+        for key in list( cls.registry.keys() ):
+            if ( connection_key is None or key[0] == connection_key ) and ( table is None or key[1] == table ):
+                del cls.registry[ key ]
+        if cls.cache_file:
+            cls.save_cache_file( cls.cache_file )
+
+    @classmethod
+    def use_cache_file( cls , path ):
+
+        """Loads any schemas persisted in path, and saves new ones there as they're loaded"""
+
+        cls.cache_file = path
+        try:
+            with open( path ) as cache:
+                for entry in json.load( cache ):
+                    cls.registry[ ( entry['connection_key'] , entry['schema']['table'] ) ] = cls.from_dict( entry['schema'] )
+        except FileNotFoundError:
+            pass
+
+    @classmethod
+    def save_cache_file( cls , path ):
+
+        # Only schemas keyed by a name ( ie a binder's schema_cache_key ) mean anything to another process
+        entries = [
+            { 'connection_key': key[0] , 'schema': schema.to_dict() }
+            for key , schema in cls.registry.items() if isinstance( key[0] , str )
+        ]
+        with open( path , 'w' ) as cache:
+            json.dump( entries , cache , indent = 4 , default = str )
+
+
+class ChangeTracker:
+
+    """Keeps the set of rows in a model that have outstanding changes, and a count of rows in each state.
+       GridRows report their state transitions here, so we never have to scan the model to find changes"""
+
+    CLEAN_STATES = ( UNCHANGED , LOCKED )
+
+    def __init__( self , on_change=None ):
+
+        self.dirty = {} # GridRow => None. A dict, so rows come back in the order they were changed
+        self.counts = collections.Counter()
+        self.on_change = on_change
+        self.journal = [] # ( kind , row , generation , column , old_value , old_state , first ), oldest 1st
+
+    def row_state_changed( self , row , old_state , new_state ):
+
+        if old_state not in self.CLEAN_STATES:
+            self.counts[ old_state ] -= 1
+        if new_state in self.CLEAN_STATES:
+            self.dirty.pop( row , None )
+            # Anything in the journal for this row is now history
+            row._journal_generation = row._journal_generation + 1
+            if not self.dirty:
+                self.journal.clear()
+        else:
+            self.dirty[ row ] = None
+            self.counts[ new_state ] += 1
+        if self.on_change:
+            self.on_change( self )
+
+    def discard( self , row ):
+
+        # For rows that are leaving the model
+        if row in self.dirty:
+            del self.dirty[ row ]
+            self.counts[ row.row_state ] -= 1
+            row._journal_generation = row._journal_generation + 1
+            if not self.dirty:
+                self.journal.clear()
+            if self.on_change:
+                self.on_change( self )
+
+    def record( self , kind , row , column=None , old_value=None , old_state=None , first=False ):
+
+        """Adds an entry to the undo journal. kind is 'cell' ( a value changed ), 'state' ( eg a delete )
+           or 'insert'. first says this was the 1st change to a cell, ie old_value is the original value"""
+
+        self.journal.append( ( kind , row , row._journal_generation , column , old_value , old_state , first ) )
+
+    def take_entries( self , rows=None , column=None ):
+
+        """Removes and returns the journal entries for some rows ( and a column ), newest 1st.
+           Entries for rows that have since been applied or refreshed are dropped along the way"""
+
+        wanted = None if rows is None else set( rows )
+        taken = []
+        kept = []
+        for entry in self.journal:
+            kind , row , generation , entry_column = entry[:4]
+            if generation != row._journal_generation:
+                continue
+            if ( wanted is None or row in wanted ) and ( column is None or entry_column == column ):
+                taken.append( entry )
+            else:
+                kept.append( entry )
+        self.journal = kept
+        taken.reverse()
+        return taken
+
+    def any_changes( self ):
+
+        return bool( self.dirty )
+
+    def dirty_rows( self ):
+
+        return list( self.dirty )
+
+    def summary( self ):
+
+        """Returns eg '3 inserted / 12 changed / 1 deleted', or an empty string if there's nothing outstanding"""
+
+        parts = []
+        for state , text in ( ( INSERTED , "inserted" ) , ( CHANGED , "changed" ) , ( DELETED , "deleted" ) ):
+            if self.counts[ state ]:
+                parts.append( "{0} {1}".format( self.counts[ state ] , text ) )
+        return " / ".join( parts )
+
+
+class GridRow( GObject.Object ):
+    __gtype_name__ = 'GridRow'
+
+    """The base class for a row in a model. Gtk4DbAbstract.generate_grid_row_class() creates a subclass
+       with a property for each column in the query"""
+
+    _attributes = []
+    _kinds = {}          # column name => kind ( see GRID_ROW_KINDS ), for columns that aren't 'str'
+    _journal_generation = 0 # bumped by the ChangeTracker each time this row's journal entries go stale
+
+    def __init__( self , track , record , tracker=None ):
+
+        super().__init__()
+        self._track = track
+        self._tracker = tracker # a ChangeTracker, told about row_state transitions
+        self._row_state = UNCHANGED
+        self._original_values_dict = {} # mainly useful for DBs that allow updates to primary keys
+        # Unpack record into class attributes
+        self.__dict__.update( zip( self._attributes , record ) )
+
+    @GObject.Property( type=str )
+    def row_state( self ):
+        return self._row_state
+
+    @row_state.setter
+    def row_state( self , row_state ):
+        if self._row_state != row_state:
+            if self._tracker:
+                self._tracker.row_state_changed( self , self._row_state , row_state )
+            self._row_state = row_state
+            self.notify( "row_state" )
+
+    def track( self ):
+        return self._track
+
+    def notify_column( self , column ):
+
+        # A typed column's native property changes with it
+        self.notify( column )
+        if column in self._kinds:
+            self.notify( column + NATIVE_PROPERTY_SUFFIX )
+
+    def native_property( self , column ):
+
+        """Returns the name of the property widgets should bind to for a column: the native property for typed
+           columns ( so an emptied entry can store NULL ), or the column's own property"""
+
+        return column + NATIVE_PROPERTY_SUFFIX if column in self._kinds else column
+
+    def refresh_values( self , record ):
+
+        """Writes a fresh record from the database into this row, and discards any local changes.
+           Only columns whose value actually changed emit notify signals"""
+
+        for attribute , value in zip( self._attributes , record ):
+            if self.__dict__.get( attribute ) != value:
+                self.__dict__[ attribute ] = value
+                self.notify_column( attribute[1:] )
+        self._original_values_dict = {}
+        self.row_state = UNCHANGED
+
+    def get_value( self , column ):
+
+        """Returns the native value of a column, with None for NULL. Reading the property instead gives
+           a default ( 0 , 0.0 , False ) for NULLs in typed columns, as GValues can't be NULL"""
+
+        return self.__dict__[ '_' + column ]
+
+    def set_value( self , column , value ):
+
+        """Sets a column ( None for NULL ). If the value changed, the original value is recorded,
+           and the row_state moves from UNCHANGED to CHANGED ( or EMPTY to INSERTED )"""
+
+        kind = self._kinds.get( column , 'str' )
+        if kind != 'str' and isinstance( value , str ):
+            value = parse_grid_value( kind , value )
+        attribute = '_' + column
+        current_value = self.__dict__[ attribute ]
+        if kind == 'str' and value is not None and current_value is not None:
+            changed = str( current_value ) != str( value )
+        else:
+            changed = current_value != value
+        if changed:
+            if self._tracker:
+                self._tracker.record( 'cell' , self , column , current_value , self.row_state
+                                    , first = column not in self._original_values_dict )
+            if self.row_state in ( UNCHANGED , CHANGED ) and column not in self._original_values_dict:
+                self.set_original_value( column , current_value )
+            if self.row_state == UNCHANGED:
+                self.row_state = CHANGED
+            elif self.row_state == EMPTY:
+                self.row_state = INSERTED
+            self.__dict__[ attribute ] = value
+            self.notify_column( column )
+
+    def write_back( self , values ):
+
+        """Writes values from the database ( eg defaults + trigger results after an insert / update ) into this
+           row, without touching the row_state. Only columns whose value changed emit notify signals"""
+
+        for column , value in values.items():
+            attribute = '_' + column
+            if attribute in self.__dict__ and self.__dict__[ attribute ] != value:
+                self.__dict__[ attribute ] = value
+                self.notify_column( column )
+
+    def restore_value( self , column , value , original=False ):
+
+        """Puts back a value from the undo journal. If it's the original value, the column is no longer changed"""
+
+        if original:
+            self._original_values_dict.pop( column , None )
+        attribute = '_' + column
+        if self.__dict__[ attribute ] != value:
+            self.__dict__[ attribute ] = value
+            self.notify_column( column )
+
+    def set_original_value( self , column , value ):
+        self._original_values_dict[ column ] = value
+
+    def get_original_value( self , column ):
+        if column in self._original_values_dict.keys():
+            return self._original_values_dict[ column ]
+        else:
+            return self.get_value( column )
+
+
+def parse_grid_value( kind , text ):
+
+    """Parses text from a widget into a native value for a column of the given kind. Empty text is NULL.
+       For numbers, anything that isn't part of the number ( currency symbols, separators ) is dropped"""
+
+    if kind == 'bool':
+        text = text.strip().lower()
+        if text == "":
+            return None
+        return text.startswith( ( 't' , 'y' , '1' ) )
+    text = re.sub( r"[^\d\.\-]" , "" , text )
+    if text == "":
+        return None
+    if kind == 'int':
+        return int( float( text ) )
+    elif kind == 'float':
+        return float( text )
+    return text
+
+
+def comparable_key( values ):
+
+    """Returns a tuple of key values that compares equal across the types the same key can arrive as, eg a
+       parent row holding 5 , '5' or Decimal( '5' ), or a date or its text, against what a child query returns"""
+
+    key = []
+    for value in values:
+        if value is None or isinstance( value , str ):
+            key.append( value )
+        elif isinstance( value , numbers.Number ) and not isinstance( value , bool ):
+            try:
+                key.append( str( int( value ) ) if value == int( value ) else str( value ) )
+            except ( ValueError , OverflowError ):
+                key.append( str( value ) )
+        else:
+            key.append( str( value ) )
+    return tuple( key )
+
+
+def grid_row_property( column_name , kind='str' ):
+
+    """Returns a GObject.Property for a column in a GridRow subclass, with a GType matching the kind of
+       column. Changing the value moves the row_state from UNCHANGED to CHANGED ( or EMPTY to INSERTED )"""
+
+    attribute = '_' + column_name
+    gtype , convert = GRID_ROW_KINDS[ kind ]
+
+    def getter( self ):
+        value = self.__dict__[ attribute ]
+        if convert is None:
+            return value
+        elif value is None:
+            return convert()
+        return convert( value )
+
+    def setter( self , value ):
+        self.set_value( column_name , value )
+
+    return GObject.Property( type=gtype , getter=getter , setter=setter )
+
+
+def native_grid_row_property( column_name ):
+
+    """Returns a TYPE_PYOBJECT property over the same value as a typed column's property, but holding the
+       native value, with None for NULL. GValues for the typed property can't be NULL"""
+
+    def getter( self ):
+        return self.get_value( column_name )
+
+    def setter( self , value ):
+        self.set_value( column_name , value )
+
+    return GObject.Property( type=GObject.TYPE_PYOBJECT , getter=getter , setter=setter )
+
+
+class PagedGridRowModel( GObject.Object , Gio.ListModel ):
+    __gtype_name__ = 'PagedGridRowModel'
+
+    """A Gio.ListModel that reports the full row count of a query, but only fetches ( and builds GridRows for )
+       the pages that the ColumnView actually asks for. Pages are kept in an LRU, which is trimmed back to
+       cache_budget ( bytes, estimated ). Rows that have outstanding changes are never evicted, so nothing
+       is lost before apply() has run."""
+
+    # A rough guess at what a GridRow costs us, on top of the values it holds
+    GRID_ROW_OVERHEAD = 512
+
+    def __init__( self , grid_row_class , row_count , fetch_page , page_size=500 , cache_budget=64 * 1024 * 1024
+                , first_page=None ):
+
+        super().__init__()
+        self.grid_row_class = grid_row_class
+        self.change_tracker = ChangeTracker()
+        self.row_count = row_count
+        self.fetch_page = fetch_page # fetch_page( offset , limit ) returns a list of records
+        self.page_size = page_size
+        self.cache_budget = cache_budget
+        self.rows = {}       # position => GridRow
+        self.page_lru = collections.OrderedDict() # page number => None, oldest 1st
+        self.row_bytes = None
+        if first_page is not None:
+            self.load_page( 0 , first_page )
+
+    def do_get_item_type( self ):
+
+        return self.grid_row_class.__gtype__
+
+    def do_get_n_items( self ):
+
+        return self.row_count
+
+    def do_get_item( self , position ):
+
+        if position >= self.row_count:
+            return None
+        page = position // self.page_size
+        if position not in self.rows:
+            self.load_page( page , self.fetch_page( page * self.page_size , self.page_size ) )
+        else:
+            self.page_lru[ page ] = None
+            self.page_lru.move_to_end( page )
+        return self.rows.get( position )
+
+    def load_page( self , page , records ):
+
+        offset = page * self.page_size
+        for i , record in enumerate( records ):
+            position = offset + i
+            if position >= self.row_count:
+                break
+            if self.row_bytes is None:
+                self.row_bytes = self.GRID_ROW_OVERHEAD + sys.getsizeof( record ) + sum( sys.getsizeof( v ) for v in record )
+            # Never clobber a row we already have - it might have outstanding changes
+            if position not in self.rows:
+                self.rows[ position ] = self.grid_row_class( position , record , self.change_tracker )
+        self.page_lru[ page ] = None
+        self.page_lru.move_to_end( page )
+        self.evict( keep_page = page )
+
+    def evict( self , keep_page=None ):
+
+        if not self.row_bytes:
+            return
+        max_rows = max( self.cache_budget // self.row_bytes , self.page_size )
+        while len( self.rows ) > max_rows and len( self.page_lru ) > 1:
+            page , _ = self.page_lru.popitem( last=False )
+            if page == keep_page:
+                self.page_lru[ page ] = None
+                continue
+            offset = page * self.page_size
+            for position in range( offset , offset + self.page_size ):
+                row = self.rows.get( position )
+                if row is not None and not self.is_dirty( row ):
+                    del self.rows[ position ]
+
+    def is_dirty( self , row ):
+
+        return row.row_state not in ( UNCHANGED , LOCKED )
+
+    def cached_rows( self ):
+
+        """Returns ( position , grid_row ) tuples for all rows currently in memory, in position order.
+           Dirty rows are always in memory, so this is all that apply() and friends need to look at."""
+
+        return sorted( self.rows.items() )
+
+    def append( self , grid_row ):
+
+        position = self.row_count
+        self.rows[ position ] = grid_row
+        self.row_count = self.row_count + 1
+        self.items_changed( position , 0 , 1 )
+
+    def remove( self , position ):
+
+        self.splice( position , 1 , [] )
+
+    def splice( self , position , n_removals , additions ):
+
+        """Same semantics as Gio.ListStore.splice(). Rows after the splice point are shifted in the cache,
+           so their positions keep matching the offsets in the ( already updated ) database"""
+
+        shift = len( additions ) - n_removals
+        shifted = {}
+        for row_position , row in self.rows.items():
+            if row_position < position:
+                shifted[ row_position ] = row
+            elif row_position >= position + n_removals:
+                shifted[ row_position + shift ] = row
+        for i , row in enumerate( additions ):
+            shifted[ position + i ] = row
+        self.rows = shifted
+        self.row_count = self.row_count + shift
+        # Pages are now partially populated, which is fine - do_get_item() fills the gaps on demand
+        self.page_lru = collections.OrderedDict( ( p // self.page_size , None ) for p in sorted( self.rows ) )
+        self.items_changed( position , n_removals , len( additions ) )
+
+
+class DescribedCursor:
+
+    """Stands in for a cursor that ran on a worker thread, so its description can be handed to methods that only
+       look at that ( column_names_from_cursor(), fetch_column_info() ) back on the main thread"""
+
+    def __init__( self , description ):
+
+        self.description = description
+
+
 class SharedBufferWindow:
 
     def __init__( self , shared_mem_db , shared_copy_sources , target_binder ):
@@ -264,6 +1071,38 @@ class Gtk4DbAbstract( object ):
     shared_mem_db = None
     shared_copy_sources = None
 
+    # The ChangeTracker for our current model. See generate_model()
+    change_tracker = None
+
+    # A pending ( debounced ) requery for a new parent record. See handle_parent_foreign_key_update()
+    parent_requery_source_id = None
+
+    # The parent keys of our current query, if a parent bound us, and our cache of results per parent key
+    parent_key = None
+    child_cache = None
+
+    # If set, inserts and updates write server-side values ( defaults, triggers ... ) back into the GridRow
+    write_back_server_values = False
+
+    # Batched inserts of at least this many rows go via COPY, where the backend supports it
+    copy_threshold = 1000
+
+    # GridRow classes, keyed by their column names and kinds. See generate_grid_row_class()
+    grid_row_classes = {}
+
+    # Declared ( catalog ) column types => renderer types. See renderer_type()
+    renderer_types = {}
+
+    # DML templates, least recently used 1st. See compiled_statement()
+    compiled_statements = collections.OrderedDict()
+
+    # See column_from_sql_name()
+    sql_name_to_column_mapping = {}
+    sql_name_mapping_fieldlist = None
+
+    # Only datasheets run queries in the background at this point
+    query_running = False
+
     def setup_fields( self , rebuild=False  ):
 
         if rebuild:
@@ -317,11 +1156,14 @@ class Gtk4DbAbstract( object ):
                 fieldtype = self.column_info[ sql_name ]['type']
                 if not fieldtype:
                     field['type'] = "text"
-                elif re.search( r'INT|DOUBLE' , fieldtype , re.IGNORECASE ):
+                elif fieldtype == "number" or re.search( r'INT|DOUBLE' , fieldtype , re.IGNORECASE ):
                     field['type'] = "number"
                     # Setting up a number hash forces numeric sorting
                     if "number" not in field.keys():
                         field['number'] = {}
+                elif fieldtype in ( "text" , "date" , "timestamp" , "time" ):
+                    # Already one of ours, eg mapped from the catalog by apply_table_schema()
+                    field['type'] = fieldtype
                 elif re.search( r'CHAR' , fieldtype , re.IGNORECASE ):
                     field['type'] = "text"
                 elif re.search( r'TIMESTAMP' , fieldtype , re.IGNORECASE ):
@@ -336,12 +1178,41 @@ class Gtk4DbAbstract( object ):
             if field['type'] == "none":
                 field['type'] = "hidden"
 
+            if 'kind' not in field.keys():
+                field['kind'] = self.column_kind( field )
+
             field['column'] = column_no
             column_no = column_no + 1
         self.fields_setup = True
 
         return True
 
+    def column_kind( self , field ):
+
+        """Returns the kind of value ( see GRID_ROW_KINDS ) we store for a field. Only number and checkbutton
+           columns with a declared integer / floating point / boolean type get typed properties. Everything
+           else ( including numeric / decimal, so we don't lose precision, and drop-down keys ) is bound as text"""
+
+        if field['name'] in self.drop_downs:
+            # Drop-downs look NULL up as '< nothing selected >', and a typed property would give them 0
+            return 'str'
+        sql_name = self.column_name_to_sql_name( field['name'] )
+        info = self.column_info.get( sql_name , {} )
+        declared = info.get( 'declared_type' ) or info.get( 'type' ) or ''
+        return self.kind_for_type( field['type'] , declared )
+
+    def kind_for_type( self , field_type , declared ):
+
+        # The kind for a renderer type + declared type. See column_kind()
+        if field_type == "number":
+            if re.search( r'^(TINY|SMALL|MEDIUM|BIG)?INT(EGER)?\d*\b' , declared , re.IGNORECASE ):
+                return 'int'
+            elif re.search( r'DOUBLE|FLOAT|REAL' , declared , re.IGNORECASE ):
+                return 'float'
+        elif field_type == "checkbutton" and re.search( r'BOOL' , declared , re.IGNORECASE ):
+            return 'bool'
+        return 'str'
+
     def dialog( self , title="Gtk4 DB Binder dialog" , type="info" , text=None , markup = None , default = None
               , handler=None ):
 
@@ -465,17 +1336,93 @@ class Gtk4DbAbstract( object ):
 
         self._do_query()
 
-        if self.on_query:
+        # Async queries call on_query() themselves, once all rows have arrived
+        if self.on_query and not self.query_running:
             self.on_query()
 
         return True
 
-    def _do_query( self ):
+    def _do_query( self , limit=None ):
 
         """Generates and executes a query to fetch data.
         Fetches primary keys and column info
+        If a limit is passed, only the 1st page of that many rows is requested
         Returns a cursor ( not yet fetched from )"""
 
+        sql = self._prepare_query_sql( paged = bool( limit ) )
+        if limit:
+            sql = self._db_prepare_page_sql( sql , limit , 0 )
+
+        try:
+            cursor = self.connection.cursor()
+            # A child requery sends the same SQL for every parent record, so it's worth preparing
+            self.execute( cursor , sql , self.sql['bind_values'] , prepare = self.parent_key is not None )
+        except Exception as e:
+            print( "Oh nos! {0}".format( e ) )
+            if self.dump_on_error:
+                print ( "SQL was:\n{0}".format( sql ) )
+            return False
+
+        self.fieldlist = self.column_names_from_cursor( cursor )
+        self.column_info = self.apply_table_schema( self.fetch_column_info( cursor ) )
+
+        self.new_where_dict = {}
+
+        return cursor
+
+    def schema_registry_key( self ):
+
+        # Schemas are shared per connection. A schema_cache_key names the database, so schemas can be persisted
+        return self.schema_cache_key if self.schema_cache_key else id( self.connection )
+
+    def table_schema( self ):
+
+        """Returns the TableSchema for the table we're bound to, or None if we're not bound to a single, plain table"""
+
+        if 'pass_through' in self.sql.keys() or not re.match( r'^[\w\.]+$' , self.sql.get( 'from' , '' ) ):
+            return None
+        return TableSchema.get( self , self.sql['from'] )
+
+    def apply_table_schema( self , column_info ):
+
+        """Overlays the declared column types, nullability and defaults from the catalog onto what the cursor told us.
+           For some backends ( SQLite ... ) the cursor tells us nothing about types. Declared types are mapped to
+           renderer types ( see renderer_type() ), and kept as declared_type for column_kind()"""
+
+        schema = self.table_schema()
+        if schema:
+            for name , info in column_info.items():
+                column = schema.column( name )
+                if column:
+                    if column['type']:
+                        info['declared_type'] = column['type']
+                        info['type'] = self.renderer_type( column['type'] )
+                    info['nullable'] = column['nullable']
+                    info['default'] = column['default']
+        return column_info
+
+    def table_column_info( self , table ):
+
+        """Returns a list of { 'name' , 'type' , 'nullable' , 'default' } dicts, in column order,
+           from the database catalog. Sub-classes implement this where they can"""
+
+        return []
+
+    def renderer_type( self , declared ):
+
+        """Maps a declared type from table_column_info() to a renderer type: number, text, date, timestamp or time,
+           via the backend's renderer_types. Lengths, precisions and MySQL's unsigned / zerofill are ignored.
+           Anything we don't know is text - including time zone aware types, which our plain timestamp casts
+           would strip the offset from"""
+
+        base = re.sub( r'\s*\([^)]*\)|\s+(unsigned|zerofill)\b' , '' , declared , flags=re.IGNORECASE )
+        return self.renderer_types.get( base.strip().lower() , "text" )
+
+    def _prepare_query_sql( self , paged=False ):
+
+        """Fetches primary keys if we need them, and assembles the select statement for the current
+        sql definition. The statement is also kept in self.select_sql"""
+
         if hasattr( self , 'before_query' ):
             self.before_query()
 
@@ -485,44 +1432,66 @@ class Gtk4DbAbstract( object ):
         if not self.primary_keys:
             if self.read_only or 'pass_through' in self.sql.keys():
                 self.primary_keys = []
+            elif self.table_schema():
+                self.primary_keys = list( self.table_schema().primary_keys )
             else:
                 self.primary_keys = self.primary_key_info( None , None , self.sql['from'] )
 
-        sql = ""
-        if 'pass_through' in self.sql.keys():
-            sql = self.sql['pass_through']
-        else:
-            sql = "select {0}".format( self.sql['select'] )
-            if self.sql['select'] != "*":
-                sql_fields = [ x.strip() for x in self.sql['select'].split( ',' ) ]
-                for primary_key_item in self.primary_keys:
-                    if primary_key_item not in sql_fields:
-                        sql = sql + ", {0}".format( primary_key_item )
-            sql = sql + " from {0}".format( self.sql['from'] )
-            if 'where' in self.sql.keys():
-                sql = sql + " where {0}".format( self.sql['where'] )
-            if 'order_by' in self.sql.keys():
-                sql = sql + " order by {0}".format( self.sql['order_by'] )
-            if 'limit' in self.sql.keys():
-                sql = sql + " limit {0}".format( self.sql['limit'] )
+        sql = self._assemble_select_sql( self.sql , paged )
         if 'bind_values' not in self.sql.keys():
             self.sql['bind_values'] = []
 
-        try:
-            cursor = self.connection.cursor()
-            self.execute( cursor , sql , self.sql['bind_values'] )
-        except Exception as e:
-            print( "Oh nos! {0}".format( e ) )
-            if self.dump_on_error:
-                print ( "SQL was:\n{0}".format( sql ) )
-            return False
+        # We keep the un-paged SQL around, so pages can be fetched on demand later
+        self.select_sql = sql
 
-        self.fieldlist = self.column_names_from_cursor( cursor )
-        self.column_info = self.fetch_column_info( cursor )
+        return sql
 
-        self.new_where_dict = {}
+    def _assemble_select_sql( self , sql_definition , paged=False ):
 
-        return cursor
+        # Builds the select statement for an sql definition ( ours, or a variation of it ). No hooks are run
+        if 'pass_through' in sql_definition.keys():
+            return sql_definition['pass_through']
+
+        sql = "select {0}".format( sql_definition['select'] )
+        if sql_definition['select'] != "*":
+            sql_fields = [ x.strip() for x in sql_definition['select'].split( ',' ) ]
+            for primary_key_item in self.primary_keys:
+                if primary_key_item not in sql_fields:
+                    sql = sql + ", {0}".format( primary_key_item )
+        sql = sql + " from {0}".format( sql_definition['from'] )
+        if 'where' in sql_definition.keys():
+            sql = sql + " where {0}".format( sql_definition['where'] )
+        if 'order_by' in sql_definition.keys():
+            sql = sql + " order by {0}".format( sql_definition['order_by'] )
+        elif paged and self.primary_keys:
+            # Paging through a result set needs a stable order
+            sql = sql + " order by {0}".format( " , ".join( self.primary_keys ) )
+        if 'limit' in sql_definition.keys():
+            sql = sql + " limit {0}".format( sql_definition['limit'] )
+        return sql
+
+    def _db_prepare_page_sql( self , sql , limit , offset ):
+
+        # Wrap a select statement so it only returns 1 page of rows.
+        # Sub-classes can override this for databases without limit / offset, eg Oracle
+
+        return "select * from ( {0} ) paged_query limit {1} offset {2}".format( sql , limit , offset )
+
+    def fetch_page( self , offset , limit ):
+
+        """Fetches 1 page of the current query. Used by the PagedGridRowModel"""
+
+        cursor = self.connection.cursor()
+        self.execute( cursor , self._db_prepare_page_sql( self.select_sql , limit , offset ) , self.sql['bind_values'] )
+        return cursor.fetchall()
+
+    def count_rows( self ):
+
+        """Returns the number of rows the current query would return, without fetching them"""
+
+        cursor = self.connection.cursor()
+        self.execute( cursor , "select count(*) from ( {0} ) counted_query".format( self.select_sql ) , self.sql['bind_values'] )
+        return cursor.fetchone()[0]
 
     def insert( self , button = None , row_state = INSERTED , columns_and_values = {} , *args ):
 
@@ -532,8 +1501,9 @@ class Gtk4DbAbstract( object ):
 
         foreign_keys = {}
         if self.foreign_key_binder:
-            foreign_keys = json.loads( self.foreign_key_binder.keys_dict_json )
-            if not foreign_keys:
+            foreign_keys = self.foreign_key_binder.keys_dict()
+            # EMPTY rows are placeholders ( eg for a form with no records ), which are fine without a parent
+            if row_state != EMPTY and not self.foreign_key_binder.populated():
                 self.dialog(
                     title  = "Can't insert yet!"
                   , type   = "error"
@@ -550,9 +1520,11 @@ class Gtk4DbAbstract( object ):
                 this_value = foreign_keys[ i ]
             new_record_values.append( this_value )
 
-        new_grid_row = self.grid_row_class( len( self.model ) , new_record_values )
+        new_grid_row = self.grid_row_class( len( self.model ) , new_record_values , self.change_tracker )
         new_grid_row.row_state = row_state
         self.model.append( new_grid_row )
+        if row_state == INSERTED:
+            self.change_tracker.record( 'insert' , new_grid_row )
 
         if self.on_insert:
             self.on_insert( new_grid_row )
@@ -561,29 +1533,115 @@ class Gtk4DbAbstract( object ):
 
     def undo( self , *args ):
 
-        self.query( dont_apply=True )
+        """Throws away all local edits, without going back to the database"""
+
+        self.undo_changes()
         return True
 
+    def undo_row( self , grid_row=None ):
+
+        """Throws away local edits to 1 row ( the current row by default )"""
+
+        grid_row = grid_row or self.get_current_grid_row()
+        if grid_row:
+            self.undo_changes( rows = [ grid_row ] )
+        return True
+
+    def undo_cell( self , column_name , grid_row=None ):
+
+        """Restores the original value of 1 column in 1 row ( the current row by default )"""
+
+        grid_row = grid_row or self.get_current_grid_row()
+        if grid_row:
+            self.undo_changes( rows = [ grid_row ] , column = column_name )
+        return True
+
+    def undo_changes( self , rows=None , column=None ):
+
+        """Replays the change journal backwards: edited values are restored, deleted rows are un-deleted,
+           and inserted rows are dropped from the model. rows and column limit what gets undone.
+           Returns the number of journal entries we replayed"""
+
+        if not self.change_tracker:
+            return 0
+
+        entries = self.change_tracker.take_entries( rows , column )
+        inserted_rows = []
+        for kind , row , generation , entry_column , old_value , old_state , first in entries:
+            if kind == 'cell':
+                row.restore_value( entry_column , old_value , first )
+                if column is None:
+                    row.row_state = old_state
+                elif row.row_state == CHANGED and not row._original_values_dict:
+                    # That was the last changed column in this row
+                    row.row_state = UNCHANGED
+            elif kind == 'state':
+                row.row_state = old_state
+            elif kind == 'insert':
+                inserted_rows.append( row )
+
+        if inserted_rows:
+            self.remove_rows( inserted_rows )
+
+        return len( entries )
+
+    def rows_with_positions( self ):
+
+        """Returns ( position , grid_row ) pairs for rows that might have changes. For a paged model, this is only
+           the rows in memory - rows that haven't been fetched can't have been edited"""
+
+        if isinstance( self.model , PagedGridRowModel ):
+            return self.model.cached_rows()
+        else:
+            return enumerate( self.model )
+
+    def positions_of_rows( self , rows ):
+
+        """Returns the model positions of some GridRows. A few rows are found with ListStore.find(),
+           more than that with 1 pass over the model"""
+
+        if isinstance( self.model , Gio.ListStore ) and len( rows ) <= 8:
+            positions = []
+            for row in rows:
+                found , position = self.model.find( row )
+                if found:
+                    positions.append( position )
+            return positions
+        wanted = set( rows )
+        return [ position for position , row in self.rows_with_positions() if row in wanted ]
+
+    def remove_rows( self , rows ):
+
+        """Removes GridRows from the model ( eg after their deletes have been applied )"""
+
+        for row in rows:
+            self.change_tracker.discard( row )
+        # Remove contiguous runs of rows with 1 splice() each, working backwards so the remaining positions stay valid
+        positions = sorted( self.positions_of_rows( rows ) )
+        while positions:
+            end = positions.pop() + 1
+            start = end - 1
+            while positions and positions[-1] == start - 1:
+                start = positions.pop()
+            self.model.splice( start , end - start , [] )
+
+    def _delete_statement( self , row ):
+
+        """Returns ( sql , values , mog_values ) for deleting a row"""
+
+        sql , parameter_columns = self.compiled_statement( 'delete' , () )
+        values = [ row.get_value( primary_key_item ) for primary_key_item in parameter_columns ]
+        mog_values = [ self.mog_value( row , c , v ) for c , v in zip( parameter_columns , values ) ]
+
+        return sql , values , mog_values
+
     def _do_delete( self , row=None ):
 
-        primary_key_filter_components = []
-        values = []
-        mog_values = []
-        sql = "delete from {0} where ".format( self.sql['from'] )
-        for primary_key_item in self.primary_keys:
-            column_no = self.column_from_sql_name( primary_key_item )
-            primary_key_filter_components.append( self._db_prepare_update_column_fragment( self.fields[ column_no ] , primary_key_item ) )
-            value = getattr( row , primary_key_item )
-            values.append( value )
-            if primary_key_item in self.mogrify_column_callbacks.keys():
-                mog_values.append( '/* mogrify callback */ ' + self.mogrify_column_callbacks[ primary_key_item ]( row , value ) )
-            else:
-                mog_values.append( value )
-        sql = sql + " and ".join( primary_key_filter_components ) + ";"
+        sql , values , mog_values = self._delete_statement( row )
 
         try:
             cursor = self.connection.cursor()
-            self.execute( cursor , sql , values )
+            self.execute( cursor , sql , values , prepare=True )
         except Exception as e:
             self.dialog(
                 title="Error deleting record!"
@@ -600,18 +1658,101 @@ class Gtk4DbAbstract( object ):
 
         return True
 
+    def _db_placeholder( self ):
+
+        # The bind placeholder our DB API driver uses
+        return "%s"
+
+    def key_placeholders( self , key_columns ):
+
+        # The bind expressions for _build_key_in_filter(), for key columns of our own
+        return [ self._db_prepare_value_fragment( self.field_for_sql_name( c ) , c ) for c in key_columns ]
+
+    def _build_key_in_filter( self , key_columns , key_tuples , placeholders=None ):
+
+        """Returns ( sql , values ) for a filter matching any of key_tuples, ie 'id in ( %s , %s )',
+           or for composite keys, '( a , b ) in ( ( %s , %s ) , ( %s , %s ) )'.
+           placeholders are the bind expressions for each key column ( see key_placeholders() ), and default
+           to our driver's plain placeholder"""
+
+        if placeholders is None:
+            placeholders = [ self._db_placeholder() ] * len( key_columns )
+        values = [ v for key_tuple in key_tuples for v in key_tuple ]
+        if len( key_columns ) == 1:
+            return "{0} in ( {1} )".format( key_columns[0] , " , ".join( placeholders * len( key_tuples ) ) ) , values
+        row_fragment = "( {0} )".format( " , ".join( placeholders ) )
+        return "( {0} ) in ( {1} )".format( " , ".join( key_columns ) , " , ".join( [ row_fragment ] * len( key_tuples ) ) ) , values
+
+    def key_chunk_size( self , key_columns ):
+
+        # Keep under both the IN list limit ( Oracle's is 1000 ) and the bind parameter limit
+        return max( 1 , min( KEY_IN_MAX_KEYS , BULK_INSERT_MAX_PARAMETERS // len( key_columns ) ) )
+
+    def _bulk_delete( self , cursor , rows ):
+
+        """Deletes rows with chunked 'where key in ( ... )' statements. Returns the ( sql , values , mog_values )
+           we executed"""
+
+        key_tuples = [ tuple( row.get_value( k ) for k in self.primary_keys ) for row in rows ]
+        placeholders = self.key_placeholders( self.primary_keys )
+        chunk_size = self.key_chunk_size( self.primary_keys )
+        executed = []
+        for start in range( 0 , len( key_tuples ) , chunk_size ):
+            chunk = key_tuples[ start : start + chunk_size ]
+            key_filter , values = self._build_key_in_filter( self.primary_keys , chunk , placeholders )
+            sql = "delete from {0} where {1};".format( self.sql['from'] , key_filter )
+            # Full chunks all share the same statement, so they're worth preparing
+            self.execute( cursor , sql , values , prepare = len( chunk ) == chunk_size )
+            mog_values = [
+                self.mog_value( row , k , v )
+                for row , key_tuple in zip( rows[ start : start + chunk_size ] , chunk )
+                for k , v in zip( self.primary_keys , key_tuple )
+            ]
+            executed.append( ( sql , values , mog_values ) )
+        return executed
+
+    def _do_delete_rows( self , rows ):
+
+        """Deletes many rows in bulk. Like _do_insert() and _do_update(), this runs in whatever transaction
+           the connection is in - apply_batched() is the path that manages its own"""
+
+        cursor = self.connection.cursor()
+
+        try:
+            executed = self._bulk_delete( cursor , rows )
+        except Exception as e:
+            self.dialog(
+                title="Error deleting records!"
+              , type="error"
+              , markup="<b>Database server says:</b>\n\n{0}".format( GLib.markup_escape_text( str( e ) ) )
+            )
+            return False
+
+        if self.sql_executions_callback:
+            for sql , values , mog_values in executed:
+                mog_sql = self.mogrify( cursor=cursor , sql=sql , bind_values=values , mog_values=mog_values )
+                self.sql_executions_callback( table=self.friendly_table_name , sql=sql , bind_values=values , mog_sql=mog_sql , mog_values=mog_values )
+
+        return True
+
     def mogrify( self , cursor=None , sql='' , bind_values=[] , mog_values=[] ):
 
         return "{0}\n{1}".format( sql , to_json( bind_values , indent = 4 ) )
 
     def column_from_sql_name( self , sql_fieldname ):
 
-        # Take an *SQL* field name and return the column that the field is in
-        counter = 0
-        for field in self.fieldlist:
-            if field.upper() == sql_fieldname.upper():
-                return counter
-            counter = counter + 1
+        # Take an *SQL* field name and return the column that the field is in.
+        # The name => column map is rebuilt whenever we get a new fieldlist
+        if self.sql_name_mapping_fieldlist is not self.fieldlist:
+            self.sql_name_to_column_mapping = {}
+            for counter , field in enumerate( self.fieldlist ):
+                self.sql_name_to_column_mapping.setdefault( field.upper() , counter )
+            self.sql_name_mapping_fieldlist = self.fieldlist
+        return self.sql_name_to_column_mapping.get( sql_fieldname.upper() )
+
+    def field_for_sql_name( self , sql_fieldname ):
+
+        return self.fields[ self.column_from_sql_name( sql_fieldname ) ]
 
     def column_from_column_name( self, column_name ):
 
@@ -644,44 +1785,103 @@ class Gtk4DbAbstract( object ):
 
         return "%s"
 
+    def _db_prepare_value_fragment( self , column_definition , column_name ):
+
+        # Prepare a placeholder string for a value compared with a column, eg in key filters.
+        # It should match the right hand side of _db_prepare_update_column_fragment(), so we get the
+        # same casts + conversions
+
+        return "%s"
+
     def _db_prepare_insert_id_capture_suffix( self ):
 
-        return ""
+        if self.returning_server_values():
+            return "\nreturning *"
+        return ""
+
+    def _db_supports_returning( self ):
+
+        # Sub-classes return True if insert / update statements can have a returning clause
+        return False
+
+    def returning_server_values( self ):
+
+        """True if we collect server-side values with a returning clause, rather than re-selecting the row"""
+
+        return self.write_back_server_values and self._db_supports_returning()
+
+    def fetch_server_values( self , cursor , row , state ):
+
+        """Returns a dict of what the database now holds for a row we just inserted / updated ( on cursor ).
+           That's either the result of a returning clause, or a re-select by primary key"""
+
+        if self.returning_server_values():
+            records = cursor.fetchall()
+        else:
+            if state == INSERTED and self.auto_incrementing:
+                keys = { k: self.last_insert_id( cursor ) for k in self.primary_keys }
+            else:
+                keys = { k: row.get_value( k ) for k in self.primary_keys }
+            sql , parameter_columns = self.compiled_statement( 'reselect' , () )
+            self.execute( cursor , sql , [ keys[ k ] for k in parameter_columns ] , prepare=True )
+            records = cursor.fetchall()
+        if not records:
+            return {}
+        wanted = set( self.fieldlist )
+        return { c: v for c , v in zip( self.column_names_from_cursor( cursor ) , records[0] ) if c in wanted }
+
+    def _insert_statement( self , row ):
+
+        """Returns ( sql , values , mog_values ) for inserting a row"""
+
+        sql , parameter_columns = self.compiled_statement( 'insert' , self.insert_columns() )
+        values = [ row.get_value( c ) for c in parameter_columns ]
+        mog_values = [ self.mog_value( row , c , v ) for c , v in zip( parameter_columns , values ) ]
+
+        return sql , values , mog_values
+
+    def insert_columns( self ):
+
+        # The columns we send in an insert. Auto-incrementing keys are left to the database
+        return tuple( c for c in self.fieldlist if not ( self.auto_incrementing and c in self.primary_keys ) )
+
+    def _db_bulk_insert( self , cursor , values_list , executed , mog_values_list ):
+
+        """Inserts many rows ( each a list of values for insert_columns() ) and returns a dict of generated
+           keys ( or server values, if we're writing them back ) for each row, in order. The ( sql , values ,
+           mog_values ) of each statement we actually run are appended to executed, for sql_executions_callback.
+           Sub-classes implement this where they can. Returning None means we send 1 insert per row"""
+
+        return None
+
+    def _db_copy_insert( self , cursor , values_list , executed , columns=None , overriding="" ):
 
-    def _do_insert( self , row=None ):
+        """Inserts many rows via the backend's bulk loading path ( eg Postgres' COPY ), returning a dict
+           of keys ( or server values ) for each row, in order, and appending the statements we run to executed.
+           Returning None means we don't have one"""
 
-        sql_fields_list = []
-        values = []
-        mog_values = []
-        placeholders_list = []
+        return None
 
-        for column_name in self.fieldlist:
-            if column_name in self.primary_keys:
-                if self.auto_incrementing:
-                    continue
-            column_no = self.column_from_sql_name( column_name )
-            placeholders_list.append( self._db_prepare_insert_column_fragment( self.fields[ column_no ] , column_name ) )
-            sql_fields_list.append( column_name )
-            value = getattr( row , column_name )
-            if 'number' in self.fields[ column_no ].keys():
-                value = re.sub( "[^\d\.]", "" , value )
-            values.append( value )
-
-            if column_name in self.mogrify_column_callbacks.keys():
-                mog_values.append( '/* mogrify callback */ ' + self.mogrify_column_callbacks[ column_name ]( row , value ) )
-            else:
-                mog_values.append( value )
+    def multi_row_insert_sql( self , columns , row_count , suffix="" , overriding="" ):
 
-        sql = "insert into {0} ( {1} ) values\n ( {2} ){3};".format(
+        row_fragment = "( {0} )".format(
+            " , ".join( self._db_prepare_insert_column_fragment( self.field_for_sql_name( c ) , c ) for c in columns )
+        )
+        return "insert into {0} ( {1} ){2} values\n {3}{4};".format(
             self.sql['from']
-            , " , ".join( sql_fields_list )
-            , " , ".join( placeholders_list )
-            , self._db_prepare_insert_id_capture_suffix()
+          , " , ".join( columns )
+          , overriding
+          , "\n , ".join( [ row_fragment ] * row_count )
+          , suffix
         )
 
+    def _do_insert( self , row=None ):
+
+        sql , values , mog_values = self._insert_statement( row )
+
         try:
             cursor = self.connection.cursor()
-            self.execute( cursor , sql , values )
+            self.execute( cursor , sql , values , prepare=True )
         except Exception as e:
             self.dialog(
                 title="Error inserting record!"
@@ -697,9 +1897,11 @@ class Gtk4DbAbstract( object ):
             self.sql_executions_callback( table=self.friendly_table_name , sql=sql , bind_values=values , mog_sql=mog_sql )
 
         # If we just inserted a record, we have to fetch the primary key and replace the current '!' with it
-        if self.auto_incrementing:
+        if self.write_back_server_values:
+            row.write_back( self.fetch_server_values( cursor , row , INSERTED ) )
+        elif self.auto_incrementing:
             for key_name in self.primary_keys:
-                setattr( row , key_name , self.last_insert_id( cursor ) )
+                row.set_value( key_name , self.last_insert_id( cursor ) )
 
         self._set_record_unchanged( row=row )
 
@@ -707,65 +1909,131 @@ class Gtk4DbAbstract( object ):
 
     def _set_record_unchanged( self , row=None ):
 
+        # What we've got is now what's in the database
+        row._original_values_dict = {}
         if self.data_lock_field:
-            if getattr( row , self.column_from_sql_name( self.data_lock_field ) ):
+            if row.get_value( self.column_from_sql_name( self.data_lock_field ) ):
                 row.row_state = LOCKED
             else:
                 row.row_state = UNCHANGED
         else:
             row.row_state = UNCHANGED
 
-    def _do_update( self , row=None ):
+    def _update_statement( self , row ):
 
-        sql_fields_list = []
-        values = []
-        mog_values = []
+        """Returns ( sql , values , mog_values ) for updating the changed columns in a row,
+           or None if nothing we're allowed to update has changed"""
+
+        columns = tuple(
+            c for c in self.updatable_columns()
+            if row.get_value( c ) != row.get_original_value( c )
+        )
+        if not columns:
+            return None
 
+        sql , parameter_columns = self.compiled_statement( 'update' , columns )
+        # For databases that support updating the primary key, we need to use the *original* value in the filter
+        values = [ row.get_value( c ) for c in columns ] \
+               + [ row.get_original_value( k ) for k in self.primary_keys ]
+        mog_values = [ self.mog_value( row , c , v ) for c , v in zip( parameter_columns , values ) ]
+
+        return sql , values , mog_values
+
+    def updatable_columns( self ):
+
+        # SQL Server, amongst others, doesn't allow updates of primary keys
+        columns = []
         for column_name in self.fieldlist:
-            # SQL Server, amongst others, doesn't allow updates of primary keys
-            column_no = self.column_from_sql_name( column_name )
-            value = getattr( row , column_name )
-            original_value = row.get_original_value( column_name )
-            if (    column_name in self.primary_keys
-                    and self.dont_update_keys
-            ) or ( 'dont_update' in self.fields[ column_no ] ) \
+            field = self.field_for_sql_name( column_name )
+            if ( column_name in self.primary_keys and self.dont_update_keys ) \
+                    or 'dont_update' in field \
                     or column_name == "" \
-                    or 'sql_ignore' in self.fields[ column_no ] \
-                    or value == original_value:
+                    or 'sql_ignore' in field:
                 continue
-            sql_fields_list.append( self._db_prepare_update_column_fragment( self.fields[ column_no ] , column_name ) )
-            if 'number' in self.fields[ column_no ].keys():
-                value = re.sub( "[^\d\.]", "" , value )
-            values.append( value )
+            columns.append( column_name )
+        return columns
 
-            if column_name in self.mogrify_column_callbacks.keys():
-                mog_values.append( '/* mogrify callback */ ' + self.mogrify_column_callbacks[ column_name ]( row , value ) )
-            else:
-                mog_values.append( value )
+    def mog_value( self , row , column_name , value ):
 
-        sql = "update {0} set\n    {1}\nwhere\n    ".format(
-            self.sql['from']
-            , "\n  , ".join( sql_fields_list )
+        if column_name in self.mogrify_column_callbacks.keys():
+            return '/* mogrify callback */ ' + self.mogrify_column_callbacks[ column_name ]( row , value )
+        return value
+
+    def compiled_statement( self , operation , columns ):
+
+        """Returns an ( sql , parameter_columns ) template for an insert / update / delete of a set of columns.
+           Templates are built once, and cached per backend, table and column set ( plus anything else that
+           changes the SQL we generate ), so we don't rebuild SQL text for every row. The cache is shared by
+           all binders, so it's capped at COMPILED_STATEMENTS_MAX, dropping the least recently used"""
+
+        key = (
+            type( self )
+          , self.sql.get( 'from' )
+          , self.sql.get( 'select' ) # reselect statements return our select list
+          , operation
+          , columns
+          , tuple( self.primary_keys )
+          , self.auto_incrementing
+          , self.returning_server_values()
+          , tuple( self.field_for_sql_name( c )['type'] for c in columns + tuple( self.primary_keys ) )
         )
+        compiled_statements = Gtk4DbAbstract.compiled_statements
+        statement = compiled_statements.get( key )
+        if statement is None:
+            statement = self._compile_statement( operation , columns )
+            compiled_statements[ key ] = statement
+            while len( compiled_statements ) > COMPILED_STATEMENTS_MAX:
+                compiled_statements.popitem( last=False )
+        else:
+            compiled_statements.move_to_end( key )
+        return statement
 
-        placeholder_list = []
-        for primary_key_item in self.primary_keys:
-            column_no = self.column_from_sql_name( primary_key_item )
-            placeholder_list.append( self._db_prepare_update_column_fragment( self.fields[ column_no ] , primary_key_item ) )
-#            values.append( getattr( row , primary_key_item ) )
-            # For databases that support updating the primary key, we need to use the *original* value in the filter
-            value = row.get_original_value( primary_key_item )
-            values.append( value )
-            if primary_key_item in self.mogrify_column_callbacks.keys():
-                mog_values.append( '/* mogrify callback */ ' + self.mogrify_column_callbacks[ primary_key_item]( row , value ) )
-            else:
-                mog_values.append( value )
+    def _compile_statement( self , operation , columns ):
+
+        if operation == 'parent_filter':
+            # A child's filter on its parent's keys. See parent_filter()
+            sql = " and ".join( self._db_prepare_update_column_fragment( self.field_for_sql_name( c ) , c ) for c in columns )
+            return sql , columns
+
+        table = self.sql['from']
+        key_filter = [ self._db_prepare_update_column_fragment( self.field_for_sql_name( k ) , k ) for k in self.primary_keys ]
+
+        if operation == 'insert':
+            sql = "insert into {0} ( {1} ) values\n ( {2} ){3};".format(
+                table
+              , " , ".join( columns )
+              , " , ".join( self._db_prepare_insert_column_fragment( self.field_for_sql_name( c ) , c ) for c in columns )
+              , self._db_prepare_insert_id_capture_suffix()
+            )
+            return sql , columns
+        elif operation == 'update':
+            sql = "update {0} set\n    {1}\nwhere\n    {2}{3}\n;".format(
+                table
+              , "\n  , ".join( self._db_prepare_update_column_fragment( self.field_for_sql_name( c ) , c ) for c in columns )
+              , "\nand ".join( key_filter )
+              , "\nreturning *" if self.returning_server_values() else ""
+            )
+            return sql , columns + tuple( self.primary_keys )
+        elif operation == 'delete':
+            sql = "delete from {0} where {1};".format( table , " and ".join( key_filter ) )
+            return sql , tuple( self.primary_keys )
+        elif operation == 'reselect':
+            sql = "select {0} from {1} where {2}".format( self.sql['select'] , table , " and ".join( key_filter ) )
+            return sql , tuple( self.primary_keys )
+        else:
+            raise Exception( "Unknown statement type: {0}".format( operation ) )
+
+    def _do_update( self , row=None ):
 
-        sql = sql + "\nand ".join( placeholder_list ) + "\n;"
+        statement = self._update_statement( row )
+        if statement is None:
+            self._set_record_unchanged( row=row )
+            return True
+        sql , values , mog_values = statement
 
         try:
             cursor = self.connection.cursor()
-            self.execute( cursor , sql , values )
+            self.execute( cursor , sql , values , prepare=True )
         except Exception as e:
             print( "{0}".format( e ) )
             self.dialog(
@@ -781,6 +2049,9 @@ class Gtk4DbAbstract( object ):
             mog_sql = self.mogrify( cursor=cursor , sql=sql , bind_values=values , mog_values=mog_values )
             self.sql_executions_callback( table=self.friendly_table_name , sql=sql , bind_values=values , mog_sql=mog_sql )
 
+        if self.write_back_server_values:
+            row.write_back( self.fetch_server_values( cursor , row , CHANGED ) )
+
         self._set_record_unchanged( row=row )
 
         return True
@@ -863,13 +2134,15 @@ class Gtk4DbAbstract( object ):
 
         raise Exception( "Not implemented! ")
 
-    def execute( self , cursor , sql , params={} ):
+    def execute( self , cursor , sql , params={} , prepare=False ):
 
         start_time = time.time()
 
         try:
             if len( params ) == 0:
                 cursor.execute( sql )
+            elif prepare:
+                self._db_execute_prepared( cursor , sql , params )
             else:
                 cursor.execute( sql , params )
         except Exception as e:
@@ -878,6 +2151,68 @@ class Gtk4DbAbstract( object ):
         end_time = time.time()
         self.last_execution_time = round( ( end_time - start_time ) * 1000 ) # milliseconds
 
+    def _db_execute_prepared( self , cursor , sql , params ):
+
+        # Execute a statement we're likely to run again ( eg our DML templates ).
+        # Sub-classes can ask the driver to prepare it server-side, where supported
+
+        cursor.execute( sql , params )
+
+    def executemany( self , cursor , sql , params_list ):
+
+        start_time = time.time()
+        cursor.executemany( sql , params_list )
+        end_time = time.time()
+        self.last_execution_time = round( ( end_time - start_time ) * 1000 ) # milliseconds
+
+    def _db_autocommit( self ):
+
+        autocommit = getattr( self.connection , 'autocommit' , False )
+        if callable( autocommit ):
+            # eg MySQLdb, where autocommit() is the setter
+            return self.connection.get_autocommit()
+        return bool( autocommit )
+
+    def _db_supports_savepoints( self ):
+
+        return True
+
+    def _db_begin_transaction( self , cursor ):
+
+        """Makes sure what follows can be committed or rolled back as 1 unit, without touching any work the caller
+           has pending. In autocommit mode, we begin a transaction. Otherwise the DB-API driver has opened the
+           caller's transaction implicitly, and we set a savepoint in it. Returns what we did ( see TRANSACTION_* ),
+           for _db_end_transaction(). Sub-classes can override this where the driver has its own ideas, eg SQLite"""
+
+        if self._db_autocommit():
+            cursor.execute( "begin" )
+            return TRANSACTION_STARTED
+        elif self._db_supports_savepoints():
+            cursor.execute( "savepoint {0}".format( SAVEPOINT_NAME ) )
+            return TRANSACTION_SAVEPOINT
+        return None
+
+    def _db_end_transaction( self , cursor , transaction , commit=True ):
+
+        if transaction == TRANSACTION_STARTED:
+            cursor.execute( "commit" if commit else "rollback" )
+        elif transaction == TRANSACTION_SAVEPOINT:
+            if not commit:
+                cursor.execute( "rollback to savepoint {0}".format( SAVEPOINT_NAME ) )
+            cursor.execute( "release savepoint {0}".format( SAVEPOINT_NAME ) )
+
+    def state_to_text( self , state ):
+
+        # Better change the state indicator back into text, rather than make
+        # people use our constants. I think, anyway ...
+        if state == INSERTED:
+            return "inserted"
+        elif state == CHANGED:
+            return "changed"
+        elif state == DELETED:
+            return "deleted"
+        return ""
+
     def fetchrow_dict( self , cursor ):
 
         cursor_id = id( cursor )
@@ -903,18 +2238,14 @@ class Gtk4DbAbstract( object ):
 
     def grid_row_to_dict( self , grid_row ):
 
-        raw_values = { field: str( getattr( grid_row , field ) ) for field in self.fieldlist }
-        combo_display_strings = { field: self.combo_key_to_display_string( field , getattr( grid_row , field ) ) for field in self.fieldlist if field in self.drop_downs.keys() }
+        raw_values = { field: str( grid_row.get_value( field ) ) for field in self.fieldlist }
+        combo_display_strings = { field: self.combo_key_to_display_string( field , grid_row.get_value( field ) ) for field in self.fieldlist if field in self.drop_downs.keys() }
         return { 'raw_values': raw_values , 'combo_display_strings': combo_display_strings }
 
     def combo_key_to_display_string( self , column_name , key ):
 
         if column_name in self.drop_down_models.keys():
-            model = self.drop_down_models[ column_name ]
-            for i in model:
-                if i.key == key:
-                    return i.value
-            return None
+            return self.drop_down_models[ column_name ].value_of_key( key )
 
     def get_all_dicts( self ):
 
@@ -946,124 +2277,84 @@ class Gtk4DbAbstract( object ):
 
     def generate_grid_row_class ( self , column_definitions ):
 
-        """This method generates a GridRow class, based on the columns in the query.
-        We need to do this, as the bindings use decorators, and there doesn't appear to be a way
-        to dynamically configure decorators"""
-
-        unique_class_name = "GridRow_" + uuid.uuid4().hex[:6].upper()
-
-        class_def = "from gi.repository import Gtk, Gio, Gdk, Pango, GObject, GLib\n\n" \
-                    "class " + unique_class_name + "( GObject.Object ):\n    __gtype_name__ = '" + unique_class_name + \
-                    "'\n\n" \
-                    "    def __init__( self , track , record ):\n" \
-                    "\n" \
-                    "        super().__init__()\n" \
-                    "        self._track = track\n" \
-                    "        self._row_state = '{0}'\n".format( UNCHANGED )
-
-        class_def = class_def + "        self._original_values_dict = {} # mainly useful for DBs that allow updates to primary keys\n" \
-                    "\n" \
-                    "        # Unpack record into class attributes ... and convert NULL / None to ''\n"
-
-        access_methods = [
-            "    @GObject.Property(type=str)\n" \
-            "    def row_state( self ):\n" \
-            "        return self._row_state\n" \
-            "\n" \
-            "    @row_state.setter\n" \
-            "    def row_state( self , row_state ):\n" \
-            "        if self._row_state != row_state:\n" \
-            "            self._row_state = row_state\n" \
-            "            self.notify( \"row_state\" )\n    "
-        ]
+        """This method returns a GridRow class, based on the columns in the query.
+        Classes are built in memory, and cached by their column signature, so requerying the same select
+        reuses the same class ( and GType ) instead of registering a new one each time"""
 
-        indirect_p1 = "{0}"
-        indirect_p2 = "{1}"
-
-        for i in range( 0 , len( column_definitions ) ):
-            # class_def = class_def + "        if record[ {0} ] is not None:\n".format( i )
-            # class_def = class_def + "            self._{0} = record[ {1} ]\n".format( column_definitions[ i ]['name'] , i )
-            # class_def = class_def + "        else:\n"
-            # class_def = class_def + "            self._{0} = ''\n".format( column_definitions[ i ]['name'] )
-            # class_def = class_def + "#        print( \"{0} attr set to: {1}\".format( self._{0} ) )\n\n".format( column_definitions[ i ]['name'] , indirect_p1 )
-
-            class_def = class_def + "        self._{0} = record[ {1} ]\n".format( column_definitions[ i ]['name'] , i )
-
-            access_methods.append (
-                "    @GObject.Property(type=str)\n" \
-                "    def {0}( self ):\n" \
-                "        return self._{0}\n" \
-                "\n" \
-                "    @{0}.setter\n" \
-                "    def {0}( self , {0} ):\n" \
-                "#        print( \"In [{0}].setter() ... current: [{3}] ... new: [{4}]\".format( {0} , self._{0} ) )\n" \
-                "        if str( self._{0} ) != {0}:\n" \
-                "#            print( \"[{0}] changed\" )\n"
-                "            self.notify( \"{0}\" )\n" \
-                "            if self.row_state == '{1}':\n" \
-                "                self.set_original_value( '{0}' , self._{0} )\n" \
-                "#                print( \"grid row state ==> changed\" )\n" \
-                "                self.row_state = '{2}'\n" \
-                "                self.notify( \"row_state\" )\n" \
-                "            if self.row_state == '{5}':\n" \
-                "                self.row_state = '{6}'\n" \
-                "                self.notify( \"row_state\" )\n" \
-                "            self._{0} = {0}\n" \
-                "    ".format(
-                    column_definitions[ i ]['name'] # 0
-                    , UNCHANGED    # 1
-                    , CHANGED      # 2
-                    , indirect_p1  # 3 ==> {0}
-                    , indirect_p2  # 4 ==> {1}
-                    , EMPTY        # 5
-                    , INSERTED     # 6
-                ) )
-
-        class_def = class_def + "\n" + "\n".join( access_methods )
-
-        class_def = class_def + "\n    def track( self ):\n" \
-            "        return self._track\n" \
-            "\n" \
-            "    def set_original_value( self , column , value ):\n" \
-            "        self._original_values_dict[ column ] = value\n" \
-            "\n" \
-            "    def get_original_value( self , column ):\n" \
-            "        if column in self._original_values_dict.keys():\n" \
-            "            return self._original_values_dict[ column ]\n" \
-            "        else:\n" \
-            "            return getattr( self , column )\n"
-
-        # print( "Class definition:\n{0}".format( class_def ) )
-        tmp_class_path = "/tmp/{0}.py".format( unique_class_name )
-
-        with open( tmp_class_path , "w" ) as class_file:
-            class_file.write( class_def )
-
-        # https://stackoverflow.com/questions/67631/how-can-i-import-a-module-dynamically-given-the-full-path
-        spec = importlib.util.spec_from_file_location( unique_class_name , tmp_class_path )
-        module = importlib.util.module_from_spec( spec )
-        sys.modules[ unique_class_name ] = module
-        spec.loader.exec_module( module )
-        self.grid_row_class = getattr( module , unique_class_name )
+        self.grid_row_class = self.grid_row_class_for( column_definitions )
 
         return self.grid_row_class
 
+    def grid_row_class_for( self , column_definitions ):
+
+        # Looks up ( or builds ) the GridRow class for column_definitions, without making it our own
+        columns = tuple( ( d['name'] , d.get( 'kind' , 'str' ) ) for d in column_definitions )
+        grid_row_class = Gtk4DbAbstract.grid_row_classes.get( columns )
+
+        if grid_row_class is None:
+            signature = hashlib.sha1( "\0".join( name + ":" + kind for name , kind in columns ).encode() ).hexdigest()
+            class_name = "GridRow_" + signature
+            class_dict = {
+                '__gtype_name__': class_name
+              , '_attributes': [ '_' + name for name , kind in columns ]
+              , '_kinds': { name: kind for name , kind in columns if kind != 'str' }
+            }
+            for name , kind in columns:
+                class_dict[ name ] = grid_row_property( name , kind )
+                if kind != 'str':
+                    class_dict[ name + NATIVE_PROPERTY_SUFFIX ] = native_grid_row_property( name )
+            grid_row_class = type( class_name , ( GridRow , ) , class_dict )
+            Gtk4DbAbstract.grid_row_classes[ columns ] = grid_row_class
+
+        return grid_row_class
+
     def generate_model( self , column_definitions , data ):
 
+        """Builds a ListStore of GridRows. If we're passed a cursor, we pull records with fetchmany()
+           and add each batch with a single splice(), adapting the batch size as we go"""
+
         grid_row_class = self.generate_grid_row_class( column_definitions )
         model = Gio.ListStore.new( grid_row_class )
-        track = 0
-
-        for row in data:
-            model.append( grid_row_class( track , row ) )
-            track = track + 1
-
         self.grid_row_class = grid_row_class
         self.model = model
+        self.change_tracker = ChangeTracker()
+
+        if hasattr( data , 'fetchmany' ):
+            batch_size = MODEL_BATCH_MIN
+            while True:
+                start_time = time.time()
+                records = data.fetchmany( batch_size )
+                if not records:
+                    break
+                self.append_records_to_model( model , records )
+                batch_size = self.adapt_batch_size( batch_size , time.time() - start_time )
+        else:
+            records = list( data )
+            if records:
+                self.append_records_to_model( model , records )
 
         return model
 
-    def bind_to_child( self , child_gtk4_db_binder , column_mapping_list ):
+    def adapt_batch_size( self , batch_size , elapsed ):
+
+        # Grow batches while they're cheap, and back off if one takes long enough to stall the main loop
+        if elapsed < MODEL_BATCH_TARGET_SECONDS / 2:
+            return min( batch_size * 2 , MODEL_BATCH_MAX )
+        elif elapsed > MODEL_BATCH_TARGET_SECONDS:
+            return max( batch_size // 2 , MODEL_BATCH_MIN )
+        return batch_size
+
+    def append_records_to_model( self , model , records ):
+
+        """Builds GridRows for a batch of records and adds them to the end of the model with a single splice(),
+           so we only emit 1 items-changed signal per batch"""
+
+        track = len( model )
+        grid_row_class = self.grid_row_class
+        tracker = self.change_tracker
+        model.splice( track , 0 , [ grid_row_class( track + i , record , tracker ) for i , record in enumerate( records ) ] )
+
+    def bind_to_child( self , child_gtk4_db_binder , column_mapping_list , requery_delay=None , prefetch_neighbours=0 ):
 
         """
            Bind to a child form/datasheet object, so that when:
@@ -1071,6 +2362,10 @@ class Gtk4DbAbstract( object ):
                - a new value is entered any column in column_list
               ... we can automate the process of requerying ( which is otherwise tedious )
               ... and also handle inserts in the child object
+           If requery_delay ( ms ) is set, the child only requeries once we've stayed on a record that long,
+           so scrolling through parent records doesn't run a child query for every row we pass over
+           If prefetch_neighbours is set, and the child has a child_cache and a query_connection_factory, we also
+           fetch ( in the background ) the children of that many records either side of the current one
         """
 
         child_keys_list = []
@@ -1082,7 +2377,10 @@ class Gtk4DbAbstract( object ):
             """
             child_keys_list.append( column_mapping['target'] )
 
-        this_foreign_key_binder = child_gtk4_db_binder.create_foreign_key_binder( child_keys_list , column_mapping_list , self.friendly_table_name )
+        this_foreign_key_binder = child_gtk4_db_binder.create_foreign_key_binder(
+            child_keys_list , column_mapping_list , self.friendly_table_name , requery_delay , prefetch_neighbours
+        )
+        this_foreign_key_binder.parent_binder = self
         self.child_foreign_key_binders.append( this_foreign_key_binder )
 
         if len( self.model ):
@@ -1090,59 +2388,154 @@ class Gtk4DbAbstract( object ):
         else:
             self.sync_grid_row_to_foreign_key_binding( None , this_foreign_key_binder )
 
-    def create_foreign_key_binder( self , keys_list , mapping , parent_friendly_table_name ):
+    def create_foreign_key_binder( self , keys_list , mapping , parent_friendly_table_name , requery_delay=None , prefetch_neighbours=0 ):
 
-        self.foreign_key_binder = ForeignKeyBinder( keys_list , mapping , parent_friendly_table_name )
+        self.foreign_key_binder = ForeignKeyBinder( keys_list , mapping , parent_friendly_table_name , requery_delay , prefetch_neighbours )
+        self.foreign_key_binder.child_binder = self
         self.foreign_key_binder.connect( 'notify' , self.handle_parent_foreign_key_update )
         return self.foreign_key_binder
 
     def sync_grid_row_to_foreign_key_binding( self , grid_row , foreign_key_binding ):
             """
-              Here we assemble a keys dict and call the foreign key binder's setter method,
+              Here we assemble a keys tuple and call the foreign key binder's setter method,
               which will trigger a child requery.
               This is a separate method, which is called from above, and also when
               setting up the binding initially
             """
-            keys_dict = {}
-            for this_mapping in foreign_key_binding.mapping:
-                if grid_row:
-                    keys_dict[ this_mapping['target'] ] = getattr( grid_row , this_mapping['source'] )
-                else:
-                    keys_dict[ this_mapping['target'] ] = None
-            setattr( foreign_key_binding , 'keys_dict_json' , json.dumps( keys_dict ) )
+            if grid_row:
+                foreign_key_binding.keys = tuple( grid_row.get_value( m['source'] ) for m in foreign_key_binding.mapping )
+            else:
+                foreign_key_binding.keys = ( None , ) * len( foreign_key_binding.mapping )
 
     def handle_parent_foreign_key_update( self , foreign_key_binder , g_param_spec ):
 
-        """Here we handle a parent binder being updated"""
+        """Here we handle a parent binder being updated. Whatever we were fetching for the previous parent
+           record is now stale. The requery itself goes through the RequeryScheduler, once the current main-loop
+           iteration is done. If the binding has a requery_delay, we 1st wait until the parent's keys have been
+           stable for that long"""
 
-        keys_dict = json.loads( foreign_key_binder.keys_dict_json )
-        filter_list = []
-        key_values_list = []
-        for key in keys_dict:
-            filter_list.append( self._db_prepare_update_column_fragment( self.fields[ self.column_name_to_number_mapping[ key ] ] , key ) )
-            key_values_list.append( keys_dict[ key ] )
-        filter_string = " and ".join( filter_list )
+        self.cancel_running_query()
+        RequeryScheduler.cancel( self )
+        if self.parent_requery_source_id:
+            GLib.source_remove( self.parent_requery_source_id )
+            self.parent_requery_source_id = None
+
+        if foreign_key_binder.requery_delay:
+            self.parent_requery_source_id = GLib.timeout_add( foreign_key_binder.requery_delay , self.schedule_requery_from_parent , foreign_key_binder )
+        else:
+            RequeryScheduler.schedule( self , foreign_key_binder )
+
+    def schedule_requery_from_parent( self , foreign_key_binder ):
+
+        self.parent_requery_source_id = None
+        RequeryScheduler.schedule( self , foreign_key_binder )
+        return False
+
+    def requery_from_parent( self , foreign_key_binder ):
+
+        self.parent_requery_source_id = None
+        keys_dict = foreign_key_binder.keys_dict()
+        self.parent_key = self.parent_key_from_keys_dict( keys_dict )
+        filter_string , key_values_list = self.parent_filter( keys_dict )
 
         self.query(
             where = filter_string
           , bind_values = key_values_list
         )
 
-    def setup_drop_down_factory_and_model( self , sql , bind_values ):
+        return False
+
+    def parent_filter( self , keys_dict ):
+
+        # Returns ( where , bind_values ) to select our records for a parent's keys. The filter is compiled once,
+        # so every parent record gives us the same SQL text, and only the bind values change
+        sql , columns = self.compiled_statement( 'parent_filter' , tuple( keys_dict ) )
+        return sql , [ keys_dict[ c ] for c in columns ]
+
+    def prefetch_children( self , position ):
+
+        """Asks children bound with prefetch_neighbours to fetch the records for the parent records either side
+           of position, so moving to them doesn't have to wait for a query"""
+
+        for fkb in self.child_foreign_key_binders:
+            if not fkb.prefetch_neighbours or not fkb.child_binder:
+                continue
+            keys_dicts = []
+            for neighbour in range( position - fkb.prefetch_neighbours , position + fkb.prefetch_neighbours + 1 ):
+                if neighbour == position or neighbour < 0 or neighbour >= len( self.model ):
+                    continue
+                grid_row = self.model[ neighbour ]
+                if grid_row.row_state == INSERTED:
+                    continue # not in the database yet, so it can't have children there
+                keys_dicts.append( { m['target']: grid_row.get_value( m['source'] ) for m in fkb.mapping } )
+            if keys_dicts:
+                fkb.child_binder.prefetch_for_parents( keys_dicts )
+
+    def prefetch_for_parents( self , keys_dicts ):
+
+        # Sub-classes that can cache their result sets per parent fetch them here
+        pass
+
+    def parent_key_from_keys_dict( self , keys_dict ):
+
+        # A hashable version of a parent's keys, eg for ChildResultCache
+        return tuple( sorted( keys_dict.items() ) )
+
+    def invalidate_child_caches( self , rows ):
+
+        """Drops any result sets our children have cached for these ( just applied ) rows"""
+
+        for fkb in self.child_foreign_key_binders:
+            child_cache = fkb.child_binder.child_cache if fkb.child_binder else None
+            if not child_cache:
+                continue
+            for row in rows:
+                # If a key was just changed, the children were cached under the old one
+                for get_value in ( row.get_value , row.get_original_value ):
+                    keys_dict = { m['target']: get_value( m['source'] ) for m in fkb.mapping }
+                    child_cache.invalidate( self.parent_key_from_keys_dict( keys_dict ) )
+
+    def cancel_running_query( self ):
+
+        # Sub-classes that run queries in the background stop them here
+        pass
+
+    def _db_cancel_query( self , connection ):
+
+        # Sub-classes ask the server to abandon whatever is running on connection ( from another thread )
+        pass
+
+    def setup_drop_down_factory_and_model( self , sql , bind_values , ttl=None ):
+
+        return self.make_drop_down_factory() , self.drop_down_model( sql , bind_values , ttl )
+
+    def drop_down_model( self , sql , bind_values , ttl=None ):
+
+        # Models come from the process-wide cache, so they're shared with other binders on the same connection
+        return DropDownModelCache.get( self.connection , sql , bind_values , self.fetch_drop_down_items , ttl )
+
+    def fetch_drop_down_items( self , sql , bind_values ):
 
         cursor = self.connection.cursor()
         cursor.execute( sql , bind_values )
-        model = Gio.ListStore( item_type = KeyValueModel )
-        model.append( KeyValueModel( None , '< nothing selected >' ) )
-        for record in cursor:
-            model.append( KeyValueModel( record[0] , record[1] ) )
+        items = [ KeyValueModel( None , '< nothing selected >' ) ]
+        items.extend( KeyValueModel( record[0] , record[1] ) for record in cursor )
+        return items
+
+    def make_drop_down_factory( self ):
 
-        # Set up the factory
         factory = Gtk.SignalListItemFactory()
         factory.connect( "setup", self.on_drop_down_factory_setup )
         factory.connect( "bind", self.on_drop_down_factory_bind )
 
-        return factory , model
+        return factory
+
+    def invalidate_drop_downs( self ):
+
+        """Forces our drop-down models ( and anyone else sharing them ) to be reloaded on the next query"""
+
+        for drop_down in self.drop_downs:
+            DropDownModelCache.invalidate( self.connection , self.drop_downs[ drop_down ]['sql'] )
 
     def on_drop_down_factory_setup( self , factory , list_item ):
 
@@ -1165,13 +2558,7 @@ class Gtk4DbAbstract( object ):
     def bind_dropdown_transform_to( self , binding , value , column_name ):
 
         # Here we're transforming from the value in the model to the dropdown's "selected" position
-        model = self.drop_down_models[ column_name ]
-        position = 0
-        for row in model:
-            if str( row.key ) == str( value ):
-                return position
-            position = position + 1
-        return None
+        return self.drop_down_models[ column_name ].position_of_key( value )
 
     def bind_progress_transform_to( self , binding , this_fraction_as_str ):
 
@@ -1189,11 +2576,29 @@ class Gtk4DbAbstract( object ):
         value = row.key
         return value
 
+    def bind_number_transform_to( self , binding , value , column_name ):
+
+        """Here we're transforming from the value in the model to an entry's text. We're bound to the
+           native property ( see GridRow.native_property() ), so NULL arrives as None"""
+        return '' if value is None else str( value )
+
+    def bind_number_transform_from( self , binding , text , column_name ):
+
+        """Here we're transforming from an entry's text to the value in the model. Empty text is NULL"""
+        grid_row = binding.get_source()
+        try:
+            return parse_grid_value( grid_row._kinds.get( column_name , 'str' ) , text )
+        except ValueError:
+            # Not a number ( yet ) - leave the model alone
+            return grid_row.get_value( column_name )
+
     def bind_checkbutton_transform_to( self , binding , this_boolean_as_str ):
 
         """Here we're transforming from the value in the model to the checkbox's 'active' state"""
         if this_boolean_as_str is None:
             return False
+        elif isinstance( this_boolean_as_str , bool ):
+            return this_boolean_as_str
         elif this_boolean_as_str.lower().startswith( 'f' ) or this_boolean_as_str == str( 0 ):
             return False
         elif this_boolean_as_str.lower().startswith( 't' ) or this_boolean_as_str == str( 1 ):
@@ -1204,21 +2609,15 @@ class Gtk4DbAbstract( object ):
     def get_drop_down_text( self , column_name ):
 
         if column_name in self.drop_down_models.keys():
-            model = self.drop_down_models[ column_name ]
-            selected_key = self.get( column_name )
-            for i in model:
-                if i.key == selected_key:
-                    return i.value
-            return None
+            return self.drop_down_models[ column_name ].value_of_key( self.get( column_name ) )
 
     def set_drop_down_by_text( self , column_name , drop_down_text ):
 
         if column_name in self.drop_down_models.keys():
-            model = self.drop_down_models[ column_name ]
-            for i in model:
-                if i.value == drop_down_text:
-                    self.set( column_name , i.key )
-                    return True
+            found , key = self.drop_down_models[ column_name ].key_of_value( drop_down_text )
+            if found:
+                self.set( column_name , key )
+                return True
             self.dialog(
                 title = "Failed to set drop_down value"
               , type  = "warning"
@@ -1252,7 +2651,7 @@ class Gtk4DbAbstract( object ):
 
 class DatasheetWidget( Gtk.ScrolledWindow , Gtk4DbAbstract ):
 
-    def __init__( self , column_definitions , data , drop_downs ):
+    def __init__( self , column_definitions , data , drop_downs , model=None ):
 
         super().__init__()
 
@@ -1260,12 +2659,14 @@ class DatasheetWidget( Gtk.ScrolledWindow , Gtk4DbAbstract ):
         self.set_vexpand( True )
         self.grid_row_class = None
         self.cv_width = 0
+        self.allocated_width = 0
+        self.resize_source_id = None
         self.drop_downs = drop_downs
         self.drop_down_models = {}
         self.setup_columns( column_definitions )
-        self.model = self.generate_model( column_definitions , data )
-        self.single_selection = Gtk.SingleSelection( model = self.model )
+        self.single_selection = Gtk.SingleSelection()
         self.cv.set_model( self.single_selection )
+        self.set_data( data , model = model )
         self.set_child( self.cv )
 
         # TODO: Figure out how to apply this to everything underneath the Datasheet
@@ -1283,18 +2684,45 @@ class DatasheetWidget( Gtk.ScrolledWindow , Gtk4DbAbstract ):
     #            """ )
     # self.add_custom_styling( self.cv )
 
-        # self.connect( 'size-allocate' , self.on_container_size_allocate )
-        # self.notify( "default-width" ).connect( self.on_container_size_allocate )
-        GLib.timeout_add( 200 , self.queue_idle_resize_columns )
+    def column_signature( self ):
 
-    def queue_idle_resize_columns( self ):
+        return tuple( ( d['name'] , d['type'] ) for d in self._column_definitions )
 
-        GLib.idle_add( self.idle_resize_columns )
-        return True
+    def set_data( self , data , model=None ):
+
+        """Swaps in a new model, keeping the ColumnView, columns and factories we already have"""
+
+        if model is not None:
+            # eg a PagedGridRowModel, which fetches its own data
+            self.grid_row_class = model.grid_row_class
+            self.model = model
+            self.change_tracker = model.change_tracker
+        else:
+            self.model = self.generate_model( self._column_definitions , data )
+        self.single_selection.set_model( self.model )
+
+    def do_size_allocate( self , width , height , baseline ):
+
+        """Column widths can't be changed while we're being allocated, so when our width changes,
+           we queue an idle callback to recalculate x_percent columns"""
+
+        Gtk.ScrolledWindow.do_size_allocate( self , width , height , baseline )
+        self.allocated_width = width
+        if width != self.cv_width and not self.resize_source_id:
+            self.resize_source_id = GLib.idle_add( self.idle_resize_columns )
+
+    def do_unroot( self ):
+
+        # We're being removed from the window - don't leave a resize callback behind
+        if self.resize_source_id:
+            GLib.source_remove( self.resize_source_id )
+            self.resize_source_id = None
+        Gtk.ScrolledWindow.do_unroot( self )
 
     def idle_resize_columns( self ):
 
-        total_columnview_width = self.cv.get_width()
+        self.resize_source_id = None
+        total_columnview_width = self.allocated_width
         if total_columnview_width == self.cv_width:
             return False
 
@@ -1319,10 +2747,12 @@ class DatasheetWidget( Gtk.ScrolledWindow , Gtk4DbAbstract ):
                 if d['type'] == 'hidden':
                     this_width = 0
                 elif 'x_percent' in d.keys():
-                    this_width = available_width / ( 100 / d['x_percent'] )
+                    this_width = int( available_width * d['x_percent'] / 100 )
                 d['current_width'] = this_width
                 d['cvc'].set_fixed_width( this_width )
 
+        return False
+
     def _add_widget_styling( self , widget ):
         if self.css_provider:
             context = widget.get_style_context()
@@ -1372,12 +2802,15 @@ class DatasheetWidget( Gtk.ScrolledWindow , Gtk4DbAbstract ):
             d['cvc'] = cvc
 
         self._column_definitions = column_definitions
+        self._column_numbers = {}
+        for counter , d in enumerate( column_definitions ):
+            self._column_numbers.setdefault( d['name'] , counter )
 
     def setup( self , factory , item , type , xalign , chars , name ):
 
         if type == "label":
             widget = GridLabel( xalign=xalign , width_chars=chars , ellipsize=Pango.EllipsizeMode.END , valign=Gtk.Align.FILL , vexpand=True , column_name=name )
-        elif type == "text" or type == "date" or type == "timestamp" or type == "hidden":
+        elif type in ( "text" , "number" , "date" , "time" , "timestamp" , "hidden" ):
             widget = GridEntry( xalign=xalign , width_chars=chars , valign=Gtk.Align.FILL , vexpand=True , column_name=name )
         elif type == "checkbutton":
             widget = GridCheckButton( column_name=name )
@@ -1402,7 +2835,17 @@ class DatasheetWidget( Gtk.ScrolledWindow , Gtk4DbAbstract ):
 
         if type == "label":
             widget._binding = grid_row.bind_property( column_name , widget , "label" , GObject.BindingFlags.SYNC_CREATE )
-        elif type == "text" or type == "date" or type == "timestamp" or type == 'hidden':
+        elif type == "number":
+            widget._binding = grid_row.bind_property( grid_row.native_property( column_name )
+                                                    , widget
+                                                    , "text"
+                                                    ,  GObject.BindingFlags.SYNC_CREATE
+                                                     | GObject.BindingFlags.BIDIRECTIONAL
+                                                    , self.bind_number_transform_to
+                                                    , self.bind_number_transform_from
+                                                    , column_name
+                                                    )
+        elif type in ( "text" , "date" , "time" , "timestamp" , "hidden" ):
             widget._binding = grid_row.bind_property( column_name
                                                     , widget
                                                     , "text"
@@ -1468,12 +2911,7 @@ class DatasheetWidget( Gtk.ScrolledWindow , Gtk4DbAbstract ):
 
     def column_name_to_number( self , column_name ):
 
-        counter = 0
-        for d in self._column_definitions:
-            if d['name'] == column_name:
-                return counter
-            counter = counter + 1
-        return False
+        return self._column_numbers.get( column_name , False )
 
     def on_image_path_changed( self , model_item , pspec , list_item ):
 
@@ -1493,6 +2931,16 @@ class Gtk4PostgresAbstract( Gtk4DbAbstract ):
 
     """Postgres flavour of Gtk4DbAbstract"""
 
+    # format_type() names. timestamp / time with time zone aren't here, so they're text, and keep their offset
+    renderer_types = {
+        'smallint': "number" , 'integer': "number" , 'bigint': "number"
+      , 'numeric': "number" , 'real': "number" , 'double precision': "number"
+      , 'character varying': "text" , 'character': "text" , 'text': "text"
+      , 'date': "date"
+      , 'timestamp without time zone': "timestamp"
+      , 'time without time zone': "time"
+    }
+
     def primary_key_info( self , db=None , schema=None , table=None ):
 
         cursor = self.connection.cursor()
@@ -1521,6 +2969,30 @@ class Gtk4PostgresAbstract( Gtk4DbAbstract ):
 
         return columns
 
+    def table_column_info( self , table ):
+
+        cursor = self.connection.cursor()
+
+        sql = """SELECT
+                  a.attname                                  as name
+                , format_type( a.atttypid , a.atttypmod )    as type
+                , not a.attnotnull                           as nullable
+                , pg_get_expr( d.adbin , d.adrelid )         as default
+                FROM
+                  pg_attribute a
+                  LEFT JOIN pg_attrdef d
+                    ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+                WHERE
+                  a.attrelid = %(table_name)s::regclass
+                  AND a.attnum > 0
+                  AND NOT a.attisdropped
+                ORDER BY
+                  a.attnum"""
+
+        self.execute( cursor , sql , { "table_name": table } )
+
+        return [ record for record in self.fetchrow_dict( cursor ) ]
+
     def column_names_from_cursor( self , cursor ):
 
         """This is tragic, but Python's database API is not consistent across database backends
@@ -1533,34 +3005,168 @@ class Gtk4PostgresAbstract( Gtk4DbAbstract ):
 
         return cursor.fetchone()[0]
 
+    def _db_execute_prepared( self , cursor , sql , params ):
+
+        # psycopg ( 3 ) can prepare statements server-side. psycopg2 can't
+        if self.connection.__class__.__module__.split( '.' , 1 )[0] == 'psycopg':
+            cursor.execute( sql , params , prepare=True )
+        else:
+            cursor.execute( sql , params )
+
     def _db_prepare_insert_column_fragment( self , column_definition , column_name ):
 
         # Prepare a placeholder string for insert statements statements ( usually just a: %s )
         # Sub-classes can do things like apply formatting or functions, eg Oracle
         # has to call to_date() for values going into date columns
 
+        return self._db_prepare_value_fragment( column_definition , column_name )
+
+    def _db_prepare_value_fragment( self , column_definition , column_name ):
+
+        # Empty strings from the grid mean NULL. Values go through text 1st, so nullif() compares text with text
+        # even when the driver binds a date / datetime object, and are then cast to the column's own type
         if column_definition['type'] == "date" or column_definition['type'] == "timestamp":
-            return "cast( nullif( %s, '' ) as timestamp )"
+            return "cast( nullif( cast( %s as text ) , '' ) as {0} )".format( column_definition['type'] )
         else:
             return "%s"
 
     def _db_prepare_insert_id_capture_suffix( self ):
 
-        if self.auto_incrementing:
+        if self.returning_server_values():
+            return "\nreturning *"
+        elif self.auto_incrementing:
             return "\nreturning {0}".format( self.primary_keys[0] )
         else:
             return ""
 
+    def _db_supports_returning( self ):
+
+        return True
+
+    def _db_cancel_query( self , connection ):
+
+        connection.cancel()
+
+    def _db_allocate_keys( self , cursor , count ):
+
+        """Takes count keys from the sequence behind our ( single ) auto-incrementing key - serial and identity
+           columns both have one. Inserting rows with keys we already know lets us match what the database
+           returns to the rows we sent, whatever order it comes back in. Returns None if there's no sequence"""
+
+        if len( self.primary_keys ) != 1:
+            return None
+        cursor.execute( "select pg_get_serial_sequence( %s , %s )" , [ self.sql['from'] , self.primary_keys[0] ] )
+        sequence = cursor.fetchone()[0]
+        if sequence is None:
+            return None
+        cursor.execute( "select nextval( %s ) from generate_series( 1 , %s )" , [ sequence , count ] )
+        return [ record[0] for record in cursor.fetchall() ]
+
+    def _db_bulk_insert( self , cursor , values_list , executed , mog_values_list ):
+
+        keys = self._db_allocate_keys( cursor , len( values_list ) )
+        if keys is None:
+            return None
+
+        # From here on, the key is just another column we send. Identity columns that are 'generated always'
+        # need 'overriding system value' to accept it
+        key_name = self.primary_keys[0]
+        columns = ( key_name , ) + self.insert_columns()
+        values_list = [ [ key ] + list( values ) for key , values in zip( keys , values_list ) ]
+        mog_values_list = [ [ key ] + list( mog_values ) for key , mog_values in zip( keys , mog_values_list ) ]
+        overriding = "\noverriding system value"
+
+        returned = self._db_copy_insert( cursor , values_list , executed , columns , overriding )
+        if returned is not None:
+            return returned
+
+        # Multi-row insert ... values ( ... ) , ( ... ), in chunks that stay under the parameter limit
+        suffix = "\nreturning *" if self.write_back_server_values else ""
+        chunk_size = max( 1 , min( BULK_INSERT_MAX_ROWS , BULK_INSERT_MAX_PARAMETERS // len( columns ) ) )
+        by_key = {}
+        for start in range( 0 , len( values_list ) , chunk_size ):
+            chunk = values_list[ start : start + chunk_size ]
+            sql = self.multi_row_insert_sql( columns , len( chunk ) , suffix , overriding )
+            values = [ v for values in chunk for v in values ]
+            # Full chunks all share the same statement, so they're worth preparing
+            self.execute( cursor , sql , values , prepare = len( chunk ) == chunk_size )
+            executed.append( ( sql , values , [ v for mog_values in mog_values_list[ start : start + chunk_size ] for v in mog_values ] ) )
+            if self.write_back_server_values:
+                column_names = self.column_names_from_cursor( cursor )
+                for record in cursor.fetchall():
+                    record = dict( zip( column_names , record ) )
+                    by_key[ record[ key_name ] ] = record
+
+        return [ by_key.get( key , { key_name: key } ) for key in keys ]
+
+    def _db_copy_insert( self , cursor , values_list , executed , columns=None , overriding="" ):
+
+        """Streams rows with COPY into a temp table ( with an ordinal column, to remember their order ), then
+           merges them into the real table with a single insert ... select. Where the rows carry their primary
+           keys, the merge returns each row's ordinal alongside what it inserted, so results are matched by
+           ordinal rather than by position. This is only worth it for big batches, and needs psycopg 3,
+           which can COPY from Python values"""
+
+        if columns is None:
+            columns = self.insert_columns()
+        if len( values_list ) < self.copy_threshold or not columns or not hasattr( cursor , 'copy' ):
+            return None
+
+        # Qualified with pg_temp, so we can never touch a real table of the same name
+        staging_table = "pg_temp.gtk4dbbinder_copy_staging"
+        column_list = " , ".join( columns )
+        cursor.execute( "drop table if exists {0}".format( staging_table ) )
+        cursor.execute(
+            "create temporary table {0} on commit drop as select 0::bigint as gtk4dbbinder_ordinal , {1} from {2} with no data".format(
+                staging_table , column_list , self.sql['from']
+            )
+        )
+
+        # Our insert statements turn empty strings into NULLs for dates + timestamps ( see _db_prepare_insert_column_fragment() )
+        date_positions = [ i for i , c in enumerate( columns ) if self.field_for_sql_name( c )['type'] in ( "date" , "timestamp" ) ]
+        copy_sql = "copy {0} ( gtk4dbbinder_ordinal , {1} ) from stdin".format( staging_table , column_list )
+        with cursor.copy( copy_sql ) as copy:
+            for ordinal , values in enumerate( values_list ):
+                values = list( values )
+                for i in date_positions:
+                    if values[ i ] == '':
+                        values[ i ] = None
+                copy.write_row( [ ordinal ] + values )
+        executed.append( ( copy_sql , [] , [] ) )
+
+        insert_sql = "insert into {0} ( {1} ){2}\nselect {1} from {3} order by gtk4dbbinder_ordinal".format(
+            self.sql['from'] , column_list , overriding , staging_table
+        )
+        if not self.primary_keys or not all( k in columns for k in self.primary_keys ):
+            # Nothing to join the staged rows back on
+            cursor.execute( insert_sql )
+            executed.append( ( insert_sql , [] , [] ) )
+            return [ {} ] * len( values_list )
+
+        returning = "*" if self.write_back_server_values else " , ".join( self.primary_keys )
+        sql = "with inserted as ( {0}\nreturning {1} )\nselect staged.gtk4dbbinder_ordinal , inserted.*\nfrom inserted join {2} staged on {3}".format(
+            insert_sql
+          , returning
+          , staging_table
+          , " and ".join( "staged.{0} = inserted.{0}".format( k ) for k in self.primary_keys )
+        )
+        cursor.execute( sql )
+        executed.append( ( sql , [] , [] ) )
+
+        # Put the returned rows back into the order of values_list
+        column_names = self.column_names_from_cursor( cursor )
+        returned = [ {} ] * len( values_list )
+        for record in cursor.fetchall():
+            returned[ record[0] ] = dict( zip( column_names[ 1: ] , record[ 1: ] ) )
+        return returned
+
     def _db_prepare_update_column_fragment( self , column_definition , column_name ):
 
         # Each value in our insert/update statements goes through this method.
         # Sub-classes can do things like apply formatting or functions, eg Oracle
         # has to call to_date() for values going into date columns
 
-        if column_definition['type'] == "timestamp":
-            return "{0} = cast( nullif( %s , '' ) as timestamp )".format( column_name )
-        else:
-            return "{0} = %s".format( column_name )
+        return "{0} = {1}".format( column_name , self._db_prepare_value_fragment( column_definition , column_name ) )
 
     def fetch_column_info( self , cursor ):
 
@@ -1606,6 +3212,10 @@ class Gtk4SnowflakeAbstract( Gtk4DbAbstract ):
 
     """Snowflake flavour of Gtk4DbAbstract"""
 
+    def _db_supports_savepoints( self ):
+
+        return False
+
     def primary_key_info( self , db=None , schema=None , table=None ):
 
         # TODO - implement
@@ -1659,6 +3269,13 @@ class Gtk4SnowflakeAbstract( Gtk4DbAbstract ):
         else:
             return "%s"
 
+    def _db_prepare_value_fragment( self , column_definition , column_name ):
+
+        if column_definition['type'] == "timestamp":
+            return "cast( nullif( %s , '' ) as timestamp )"
+        else:
+            return "%s"
+
     def _db_prepare_update_column_fragment( self , column_definition , column_name ):
 
         # Each value in our insert/update statements goes through this method.
@@ -1687,6 +3304,16 @@ class Gtk4MySQLAbstract( Gtk4DbAbstract ):
 
     """MySQL flavour of Gtk4DbAbstract"""
 
+    # information_schema.columns.column_type names
+    renderer_types = {
+        'tinyint': "number" , 'smallint': "number" , 'mediumint': "number" , 'int': "number" , 'bigint': "number"
+      , 'decimal': "number" , 'float': "number" , 'double': "number"
+      , 'char': "text" , 'varchar': "text" , 'tinytext': "text" , 'text': "text" , 'mediumtext': "text" , 'longtext': "text"
+      , 'date': "date"
+      , 'datetime': "timestamp" , 'timestamp': "timestamp"
+      , 'time': "time"
+    }
+
     def last_insert_id( self , cursor ):
 
         return cursor.lastrowid
@@ -1743,6 +3370,27 @@ class Gtk4MySQLAbstract( Gtk4DbAbstract ):
 
         return columns
 
+    def table_column_info( self , table ):
+
+        cursor = self.connection.cursor()
+
+        sql = """select
+                         column_name                        as name
+                       , column_type                        as type
+                       , is_nullable = 'YES'                as nullable
+                       , column_default                     as `default`
+                 from
+                         information_schema.columns
+                 where
+                         table_schema = %(table_schema)s
+                 and     table_name = %(table_name)s
+                 order by
+                         ordinal_position"""
+
+        self.execute( cursor , sql , { "table_schema": self.connection.database ,  "table_name": table } )
+
+        return [ record for record in self.fetchrow_dict( cursor ) ]
+
     def _db_prepare_insert_column_fragment( self , column_definition , column_name ):
 
         # Prepare a placeholder string for insert statements statements ( usually just a: %s )
@@ -1754,6 +3402,13 @@ class Gtk4MySQLAbstract( Gtk4DbAbstract ):
         else:
             return "%s"
 
+    def _db_prepare_value_fragment( self , column_definition , column_name ):
+
+        if column_definition['type'] == "timestamp":
+            return "nullif( %s , '' )"
+        else:
+            return "%s"
+
     def _db_prepare_update_column_fragment( self , column_definition , column_name ):
 
         # Each value in our insert/update statements goes through this method.
@@ -1770,6 +3425,16 @@ class Gtk4SQLiteAbstract( Gtk4DbAbstract ):
 
     """Postgres flavour of Gtk4DbAbstract"""
 
+    # pragma_table_info() names. SQLite accepts any declared type, so these are just the common ones
+    renderer_types = {
+        'integer': "number" , 'int': "number" , 'bigint': "number"
+      , 'numeric': "number" , 'decimal': "number" , 'real': "number" , 'double': "number" , 'float': "number"
+      , 'varchar': "text" , 'char': "text" , 'text': "text"
+      , 'date': "date"
+      , 'datetime': "timestamp" , 'timestamp': "timestamp"
+      , 'time': "time"
+    }
+
     def primary_key_info( self , db=None , schema=None , table=None ):
 
         cursor = self.connection.cursor()
@@ -1786,6 +3451,18 @@ class Gtk4SQLiteAbstract( Gtk4DbAbstract ):
 
         return columns
 
+    def table_column_info( self , table ):
+
+        # pragma_table_info gives us the declared types, which is the only place SQLite will tell us about them
+        cursor = self.connection.cursor()
+
+        sql = "select i.name , i.type , not i.\"notnull\" as nullable , i.dflt_value as \"default\"" \
+              " from pragma_table_info( ? ) as i order by i.cid"
+
+        self.execute( cursor , sql , [ table ] )
+
+        return [ record for record in self.fetchrow_dict( cursor ) ]
+
     def column_names_from_cursor( self , cursor ):
 
         """This is tragic, but Python's database API is not consistent across database backends
@@ -1799,14 +3476,80 @@ class Gtk4SQLiteAbstract( Gtk4DbAbstract ):
         cursor.execute( 'select last_insert_rowid()' )
         return cursor.fetchone()[0]
 
+    def _db_placeholder( self ):
+
+        return "?"
+
+    def _db_cancel_query( self , connection ):
+
+        # interrupt() is safe to call from a thread other than the one running the query
+        connection.interrupt()
+
+    def _db_supports_returning( self ):
+
+        # The returning clause arrived in SQLite 3.35
+        return sqlite3.sqlite_version_info >= ( 3 , 35 , 0 )
+
+    def _db_bulk_insert( self , cursor , values_list , executed , mog_values_list ):
+
+        # SQLite doesn't promise to return rows from a returning clause in any particular order, so we hand out
+        # the keys ourselves. We're inside a 'begin immediate' transaction ( see apply_batched() ), so nobody
+        # else can insert between us reading the highest key and using the ones after it
+        if self.write_back_server_values or len( self.primary_keys ) != 1 or not self.connection.in_transaction:
+            return None
+
+        key_name = self.primary_keys[0]
+        cursor.execute( "select max( {0} ) from {1}".format( key_name , self.sql['from'] ) )
+        highest = cursor.fetchone()[0] or 0
+        try:
+            # AUTOINCREMENT tables also never re-use keys of deleted rows
+            cursor.execute( "select seq from sqlite_sequence where name = ?" , [ self.sql['from'] ] )
+            record = cursor.fetchone()
+            if record:
+                highest = max( highest , record[0] )
+        except sqlite3.OperationalError:
+            pass # there's no sqlite_sequence until some table uses AUTOINCREMENT
+        if not isinstance( highest , int ):
+            return None
+
+        keys = range( highest + 1 , highest + 1 + len( values_list ) )
+        sql = self.multi_row_insert_sql( ( key_name , ) + self.insert_columns() , 1 )
+        values_list = [ [ key ] + list( values ) for key , values in zip( keys , values_list ) ]
+        self.executemany( cursor , sql , values_list )
+        executed.extend(
+            ( sql , values , [ key ] + list( mog_values ) )
+            for key , values , mog_values in zip( keys , values_list , mog_values_list )
+        )
+
+        return [ { key_name: key } for key in keys ]
+
+    def _db_begin_transaction( self , cursor ):
+
+        # With isolation_level=None ( which is how we usually open SQLite ), every statement commits on its own,
+        # so there's no autocommit flag to go by - only whether a transaction is open
+        if not self.connection.in_transaction:
+            cursor.execute( "begin immediate" )
+            return TRANSACTION_STARTED
+        cursor.execute( "savepoint {0}".format( SAVEPOINT_NAME ) )
+        return TRANSACTION_SAVEPOINT
+
     def _db_prepare_insert_column_fragment( self , column_definition , column_name ):
 
         # Prepare a placeholder string for insert statements statements ( usually just a: %s )
         # Sub-classes can do things like apply formatting or functions, eg Oracle
         # has to call to_date() for values going into date columns
 
+        # SQLite has no date types. Casting to one gives NUMERIC affinity, which turns '2024-01-05' into 2024,
+        # so we only map empty strings to NULL, and store dates as the text we're given
+        if column_definition['type'] == "date" or column_definition['type'] == "timestamp":
+            return "nullif( ? , '' )"
+        else:
+            return "?"
+
+    def _db_prepare_value_fragment( self , column_definition , column_name ):
+
         if column_definition['type'] == "date" or column_definition['type'] == "timestamp":
-            return "cast( nullif( ?, '' ) as timestamp )"
+            return "nullif( ? , '' )"
         else:
             return "?"
 
@@ -1816,8 +3559,8 @@ class Gtk4SQLiteAbstract( Gtk4DbAbstract ):
         # Sub-classes can do things like apply formatting or functions, eg Oracle
         # has to call to_date() for values going into date columns
 
-        if column_definition['type'] == "timestamp":
-            return "{0} = cast( nullif( ? , '' ) as timestamp )".format( column_name )
+        if column_definition['type'] == "date" or column_definition['type'] == "timestamp":
+            return "{0} = nullif( ? , '' )".format( column_name )
         else:
             return "{0} = ?".format( column_name )
 
@@ -1831,9 +3574,37 @@ class Gtk4SQLiteAbstract( Gtk4DbAbstract ):
         return column_info
 
 
-class Gtk4OracleAbstract( Gtk4DbAbstract ):
+class Gtk4OracleAbstract( Gtk4DbAbstract ):
+
+    """Oracle flavour of Gtk4DbAbstract"""
+
+    def _db_prepare_page_sql( self , sql , limit , offset ):
+
+        return "select * from ( {0} ) offset {2} rows fetch next {1} rows only".format( sql , limit , offset )
+
+    def _db_begin_transaction( self , cursor ):
 
-    """Oracle flavour of Gtk4DbAbstract"""
+        # Oracle has no begin - a transaction starts with the 1st DML statement. In autocommit mode, we turn
+        # autocommit off until we're done
+        if self._db_autocommit():
+            self.connection.autocommit = False
+            return TRANSACTION_STARTED
+        cursor.execute( "savepoint {0}".format( SAVEPOINT_NAME ) )
+        return TRANSACTION_SAVEPOINT
+
+    def _db_end_transaction( self , cursor , transaction , commit=True ):
+
+        # ... and there's no release savepoint either
+        if transaction == TRANSACTION_STARTED:
+            try:
+                if commit:
+                    self.connection.commit()
+                else:
+                    self.connection.rollback()
+            finally:
+                self.connection.autocommit = True
+        elif transaction == TRANSACTION_SAVEPOINT and not commit:
+            cursor.execute( "rollback to savepoint {0}".format( SAVEPOINT_NAME ) )
 
     def _db_prepare_update_column_fragment( self , column_definition , column_name ):
 
@@ -1857,6 +3628,13 @@ class Gtk4OracleAbstract( Gtk4DbAbstract ):
         else:
             return "%s"
 
+    def _db_prepare_value_fragment( self , column_definition , column_name ):
+
+        if column_definition['type'] == "date":
+            return "to_date( ? )"
+        else:
+            return "?"
+
 
 ##############################################################################################################
 # Datasheet logic
@@ -1901,7 +3679,12 @@ class Gtk4DbDatasheet( Gtk4DbAbstract ):
                  , quiet=False, recordset_items=None, on_row_select=None
                  , before_insert=None, on_insert=None , on_query=None
                  , drop_downs={}, sql_executions_callback=None , mogrify_column_callbacks={}
-                 , primary_keys=None , copy_transform_callback=None , paste_transform_callback=None , **kwargs ):
+                 , primary_keys=None , copy_transform_callback=None , paste_transform_callback=None
+                 , page_size=None , page_cache_budget=64 * 1024 * 1024
+                 , async_query=False , query_connection_factory=None , async_batch_size=1000
+                 , incremental_refresh=False , batch_apply=False , schema_cache_key=None , show_change_counts=False
+                 , write_back_server_values=False , copy_threshold=1000 , child_cache_size=0
+                 , child_cache_budget=16 * 1024 * 1024 , **kwargs ):
 
         if recordset_items is None:
             recordset_items = [ "insert", "copy" , "paste" , "undo", "delete", "apply" ] # "data_to_csv"
@@ -1919,6 +3702,7 @@ class Gtk4DbDatasheet( Gtk4DbAbstract ):
           , "undo":           { "type": "button" , "icon_name": "edit-undo" }
           , "delete":         { "type": "button" , "icon_name": "edit-delete" }
           , "apply":          { "type": "button" , "icon_name": "document-save" }
+          , "refresh":        { "type": "button" , "icon_name": "view-refresh" }
           , "data_to_csv":    { "type": "button" , "icon_name": "document-save-as" }
         }
 
@@ -1957,12 +3741,41 @@ class Gtk4DbDatasheet( Gtk4DbAbstract ):
         self.foreign_key_binder = None
         self.drop_downs = drop_downs
         self.drop_down_models = {}
+        self.drop_down_factories = {}
         self.sql_executions_callback = sql_executions_callback
         self.mogrify_column_callbacks = mogrify_column_callbacks
         self.primary_keys = primary_keys
         self.copy_transform_callback = copy_transform_callback
         self.paste_transform_callback = paste_transform_callback
         self.recordset_tools_dict = {}
+        self.page_size = page_size # if set, rows are fetched in pages of this size, as they're scrolled into view
+        self.page_cache_budget = page_cache_budget
+        self.async_query = async_query
+        self.query_connection_factory = query_connection_factory
+        self.async_batch_size = async_batch_size
+        self.query_generation = 0
+        self.query_running = False
+        self.async_query_connection = None # the worker thread's connection, while it's running a query
+        self.loading_label = None
+        self.incremental_refresh = incremental_refresh # requerying with the same sql only applies the differences
+        self.last_query_signature = None
+        self.batch_apply = batch_apply # apply() sends everything in 1 transaction, grouped into executemany() calls
+        self.schema_cache_key = schema_cache_key # names the database, so TableSchemas can be persisted
+        self.show_change_counts = show_change_counts # show eg '3 inserted / 12 changed' in the recordset toolbar
+        self.write_back_server_values = write_back_server_values # apply() picks up defaults + triggers, instead of a requery
+        self.copy_threshold = copy_threshold # batched inserts of at least this many rows go via COPY ( Postgres )
+        if child_cache_size:
+            # As a child, keep the result sets for this many parent records
+            self.child_cache = ChildResultCache( child_cache_size , child_cache_budget )
+        self.prefetch_running = False
+        self.prefetch_pending = None # the latest prefetch request that arrived while 1 was running
+        self.child_relationships = {} # see declare_child_relationship()
+        self.change_counts_label = None
+        self.change_counts_source_id = None
+        self.change_tracker = None
+
+        if self.async_query and not self.query_connection_factory:
+            raise Exception( "Gtk4DbDatasheet constructor: async_query needs a query_connection_factory" )
 
         self.setup_shared_mem_db()
 
@@ -1970,7 +3783,6 @@ class Gtk4DbDatasheet( Gtk4DbAbstract ):
             setattr( self , i , kwargs[i] )
 
         self.drop_downs = drop_downs
-        self.setup_all_drop_downs()
 
         if not len( friendly_table_name ):
             if 'from' in self.sql.keys():
@@ -1997,10 +3809,17 @@ class Gtk4DbDatasheet( Gtk4DbAbstract ):
 
         if self.recordset_tools_box:
             self.setup_recordset_tools()
+            if self.async_query:
+                self.loading_label = Gtk.Label( visible = self.query_running )
+                self.recordset_tools_box.append( self.loading_label )
+            if self.show_change_counts:
+                self.change_counts_label = Gtk.Label( visible = False )
+                self.recordset_tools_box.append( self.change_counts_label )
 
         # To avoid data-loss when a window is closed, we need to hook into the window's close_request signal,
         # check for changes, and raise a dialog asking the user to apply outstanding changes
-        parent_widget = self.datasheet.get_parent()
+        # ( in async mode, the datasheet might not exist yet, so we start from our box )
+        parent_widget = self.box
         while parent_widget:
             toplevel_widget = parent_widget
             parent_widget = toplevel_widget.get_parent()
@@ -2011,16 +3830,22 @@ class Gtk4DbDatasheet( Gtk4DbAbstract ):
     def setup_all_drop_downs( self ):
 
         for drop_down in self.drop_downs:
-            factory , model = self.setup_drop_down_factory_and_model(
-                self.drop_downs[ drop_down ]['sql']
-              , self.drop_downs[ drop_down ]['bind_values']
-            )
-            self.drop_downs[ drop_down ]['model'] = model
+            definition = self.drop_downs[ drop_down ]
+            model = self.drop_down_model( definition['sql'] , definition['bind_values'] , definition.get( 'ttl' ) )
+            definition['model'] = model
             self.drop_down_models[ drop_down ] = model
-            self.drop_downs[ drop_down ]['factory'] = factory
+            if drop_down not in self.drop_down_factories:
+                self.drop_down_factories[ drop_down ] = self.make_drop_down_factory()
+            definition['factory'] = self.drop_down_factories[ drop_down ]
 
     def destroy( self ):
 
+        # Nothing should requery us from our parent after this
+        RequeryScheduler.cancel( self )
+        if self.parent_requery_source_id:
+            GLib.source_remove( self.parent_requery_source_id )
+            self.parent_requery_source_id = None
+
         child = self.box.get_first_child()
         while child:
             self.box.remove( child )
@@ -2046,12 +3871,12 @@ class Gtk4DbDatasheet( Gtk4DbAbstract ):
     def get( self , column_name ):
 
         grid_row = self.get_current_grid_row()
-        return getattr( grid_row , column_name )
+        return grid_row.get_value( column_name )
 
     def set( self , column_name , value ):
 
         grid_row = self.get_current_grid_row()
-        setattr( grid_row , column_name , value )
+        grid_row.set_value( column_name , value )
 
     def selection_changed_handler( self , selection, first_item_changed, no_of_items_changed ):
 
@@ -2064,6 +3889,7 @@ class Gtk4DbDatasheet( Gtk4DbAbstract ):
                 if grid_row.track() != self.current_track:
                     for fkb in self.child_foreign_key_binders:
                         self.sync_grid_row_to_foreign_key_binding( grid_row , fkb )
+                    self.prefetch_children( position )
                     self.current_track = grid_row.track()
                     if self.on_row_select:
                         self.on_row_select( grid_row )
@@ -2076,38 +3902,613 @@ class Gtk4DbDatasheet( Gtk4DbAbstract ):
                 self.current_track = None
 
 
+    def query_signature( self , sql=None ):
+
+        # Identifies a query, for incremental refreshes and our child_cache
+        return repr( sorted( ( sql or self.sql ).items() ) )
+
     def _do_query( self ):
 
-        if self.datasheet:
-            self.box.remove( self.datasheet )
+        query_signature = self.query_signature()
+        if self.incremental_refresh and query_signature == self.last_query_signature and self.can_refresh():
+            return self._do_refresh()
+        self.last_query_signature = query_signature
 
         """We need to reset the current track, or we can miss handling row-selected events
           ( eg if the 1st row was selected, and we request, and again the 1st row is selected )"""
         self.current_track = None
-        cursor = super()._do_query()
+
+        # Any query still running in the background is now stale
+        self.cancel_running_query()
+        self.query_generation = self.query_generation + 1
+        self.query_running = False
+        self.set_loading_status( None )
+
+        if self.child_cache and self.parent_key is not None and not self.page_size:
+            entry = self.child_cache.get( self.parent_key , query_signature )
+            if entry:
+                return self._do_cached_query( entry )
+
+        if self.async_query and not self.page_size:
+            return self._do_async_query()
+
+        cursor = super()._do_query( limit = self.page_size )
+
+        if not self.setup_fields():
+            return None
+
+        self.setup_all_drop_downs()
+
+        if self.page_size:
+            model = PagedGridRowModel(
+                self.generate_grid_row_class( self.fields )
+              , self.count_rows()
+              , self.fetch_page
+              , page_size = self.page_size
+              , cache_budget = self.page_cache_budget
+              , first_page = cursor.fetchall()
+            )
+            self.setup_datasheet_widget( None , model = model )
+        else:
+            self.setup_datasheet_widget( cursor )
+            self.store_in_child_cache()
+
+        if self.after_query:
+            self.after_query()
+
+        return True
+
+    def _do_cached_query( self , entry ):
+
+        """Populates the datasheet from a ChildResultCache entry, without going to the database"""
+
+        self.fieldlist = entry['fieldlist']
+        self.column_info = entry['column_info']
+        self.new_where_dict = {}
 
         if not self.setup_fields():
             return None
 
         self.setup_all_drop_downs()
+        self.setup_datasheet_widget( entry['records'] )
+
+        if self.after_query:
+            self.after_query()
+
+        return True
+
+    def declare_child_relationship( self , name , sql , column_mapping_list ):
+
+        """Declares a child table whose records we fetch for many of our rows at once, with fetch_children().
+           sql is a dict like ours ( select / from , and optionally where / bind_values / order_by ), and
+           column_mapping_list maps our columns ( source ) to the child's ( target ), as in bind_to_child()"""
+
+        self.child_relationships[ name ] = {
+            'sql': sql
+          , 'mapping': column_mapping_list
+          , 'models': {} # comparable_key() of the parent's keys => Gio.ListStore of the child's GridRows
+        }
+
+    def child_column_definitions( self , table , cursor ):
+
+        """Returns column definitions, with kinds ( see column_kind() ), for a child query we've just run in
+           fetch_children(). Declared types come from the child table's TableSchema, if it's a plain table"""
+
+        column_info = self.fetch_column_info( cursor )
+        schema = TableSchema.get( self , table ) if re.match( r'^[\w\.]+$' , table ) else None
+        definitions = []
+        for name in self.column_names_from_cursor( cursor ):
+            column = schema.column( name ) if schema else None
+            if column and column['type']:
+                declared = column['type']
+                field_type = self.renderer_type( declared )
+            else:
+                declared = field_type = column_info.get( name , {} ).get( 'type' ) or ''
+            definitions.append( { 'name': name , 'kind': self.kind_for_type( field_type , declared ) } )
+        return definitions
+
+    def fetch_children( self , name , grid_rows=None ):
+
+        """Fetches the child records of a declared relationship for grid_rows ( default: all of our rows that are in
+           memory - for a paged model, that's the pages that have been scrolled into view ) with
+           'where child_key in ( ... )' queries, instead of 1 query per parent, and distributes them into a model per
+           parent. Models are reused between calls, so widgets bound to them pick up the changes.
+           Returns a dict of parent key tuple => model"""
+
+        relationship = self.child_relationships[ name ]
+        definition = relationship['sql']
+        source_columns = [ m['source'] for m in relationship['mapping'] ]
+        target_columns = [ m['target'] for m in relationship['mapping'] ]
+
+        if grid_rows is None:
+            # Iterating a PagedGridRowModel would fetch every page
+            grid_rows = [ grid_row for position , grid_row in self.rows_with_positions() ]
+        # Keys are compared with comparable_key(), as our values needn't be the same types as the child's
+        parents = {} # comparable_key() => our key tuple, in the order we 1st see each parent
+        for grid_row in grid_rows:
+            key_tuple = tuple( grid_row.get_value( c ) for c in source_columns )
+            if None not in key_tuple:
+                parents.setdefault( comparable_key( key_tuple ) , key_tuple )
+        key_tuples = list( parents.values() )
+        grouped = { key: [] for key in parents } # comparable_key() => child records
+
+        definitions = None
+        cursor = self.connection.cursor()
+        chunk_size = self.key_chunk_size( target_columns )
+
+        for start in range( 0 , len( key_tuples ) , chunk_size ):
+            key_filter , values = self._build_key_in_filter( target_columns , key_tuples[ start : start + chunk_size ] )
+            sql = "select {0} from {1} where ".format( definition['select'] , definition['from'] )
+            if 'where' in definition.keys():
+                sql = sql + "( {0} ) and ".format( definition['where'] )
+            sql = sql + key_filter
+            if 'order_by' in definition.keys():
+                sql = sql + " order by {0}".format( definition['order_by'] )
+            try:
+                self.execute( cursor , sql , list( definition.get( 'bind_values' , [] ) ) + values )
+            except Exception as e:
+                self.dialog(
+                    title="Error fetching {0}!".format( name )
+                  , type="error"
+                  , markup="<b>Database server says:</b>\n\n{0}".format( GLib.markup_escape_text( str( e ) ) )
+                )
+                if self.dump_on_error:
+                    print ( "SQL was:\n{0}".format( sql ) )
+                return None
+            if definitions is None:
+                # Typed columns get typed properties, as in generate_model()
+                definitions = self.child_column_definitions( definition['from'] , cursor )
+                positions = [ [ d['name'] for d in definitions ].index( c ) for c in target_columns ]
+            for record in cursor.fetchall():
+                key = comparable_key( record[ p ] for p in positions )
+                if key in grouped:
+                    grouped[ key ].append( record )
+
+        models = {}
+        if definitions:
+            grid_row_class = self.grid_row_class_for( definitions )
+            for key , records in grouped.items():
+                model = relationship['models'].get( key )
+                if model is None or model.get_item_type() != grid_row_class.__gtype__:
+                    model = Gio.ListStore.new( grid_row_class )
+                    relationship['models'][ key ] = model
+                model.splice( 0 , len( model ) , [ grid_row_class( track , record ) for track , record in enumerate( records ) ] )
+                models[ parents[ key ] ] = model
+
+        return models
+
+    def child_model( self , name , grid_row ):
+
+        """Returns the model fetch_children() filled for grid_row, or None if it hasn't been fetched"""
+
+        relationship = self.child_relationships[ name ]
+        key_tuple = tuple( grid_row.get_value( m['source'] ) for m in relationship['mapping'] )
+        return relationship['models'].get( comparable_key( key_tuple ) )
+
+    def prefetch_for_parents( self , keys_dicts ):
+
+        """Fetches our records for a list of parent keys in 1 query ( ie 'where parent_id in ( ... )' ), on a worker
+           thread, and puts each parent's records in our child_cache. See bind_to_child()'s prefetch_neighbours"""
+
+        if not self.child_cache or not self.query_connection_factory or not self.foreign_key_binder or self.page_size:
+            return
+        if 'pass_through' in self.sql.keys() or 'limit' in self.sql.keys() or not self.fields_setup:
+            return
+
+        if self.prefetch_running:
+            self.prefetch_pending = keys_dicts
+            return
+
+        key_columns = [ m['target'] for m in self.foreign_key_binder.mapping ]
+        wanted = {} # comparable_key() => ( key tuple , parent key , query signature )
+        for keys_dict in keys_dicts:
+            parent_key = self.parent_key_from_keys_dict( keys_dict )
+            key_tuple = tuple( keys_dict[ c ] for c in key_columns )
+            if parent_key == self.parent_key or comparable_key( key_tuple ) in wanted or None in key_tuple:
+                continue
+            where , bind_values = self.parent_filter( keys_dict )
+            signature = self.query_signature( dict( self.sql , where = where , bind_values = bind_values ) )
+            if not self.child_cache.has( parent_key , signature ):
+                wanted[ comparable_key( key_tuple ) ] = ( key_tuple , parent_key , signature )
+
+        if not wanted:
+            return
 
-        self.datasheet = DatasheetWidget( self.fields , cursor , self.drop_downs )
+        key_filter , bind_values = self._build_key_in_filter(
+            key_columns , [ key_tuple for key_tuple , parent_key , signature in wanted.values() ] , self.key_placeholders( key_columns )
+        )
+        # Built directly, rather than with _prepare_query_sql(), so the user's before_query() hook isn't run
+        sql = self._assemble_select_sql( dict( self.sql , where = key_filter ) )
+
+        self.prefetch_running = True
+        worker = threading.Thread(
+            target = self._prefetch_worker
+          , args = ( self.query_connection_factory , self.child_cache.generation , sql , bind_values , key_columns , wanted )
+          , daemon = True
+        )
+        worker.start()
+
+    def _prefetch_worker( self , connection_factory , generation , sql , bind_values , key_columns , wanted ):
+
+        # As with _async_query_worker(), nothing in here may touch Gtk - or our own state. Records are grouped
+        # back on the main thread
+        connection = None
+        try:
+            connection = connection_factory()
+            cursor = connection.cursor()
+            self.execute_in_worker( cursor , sql , bind_values )
+            records = cursor.fetchall()
+            GLib.idle_add( self._prefetch_finished , generation , key_columns , wanted , DescribedCursor( cursor.description ) , records , None )
+        except Exception as e:
+            GLib.idle_add( self._prefetch_finished , generation , key_columns , wanted , None , None , e )
+        finally:
+            if connection:
+                connection.close()
+
+    def _prefetch_finished( self , generation , key_columns , wanted , described_cursor , records , error ):
+
+        self.prefetch_running = False
+
+        if error:
+            print( "Prefetch failed: {0}".format( error ) )
+        elif generation == self.child_cache.generation:
+            # ... otherwise something was applied while we were fetching, and these records may be stale
+            fieldlist = self.column_names_from_cursor( described_cursor )
+            column_info = self.apply_table_schema( self.fetch_column_info( described_cursor ) )
+            # Group the records by their parent's keys. Keys are compared with comparable_key(), as the parent's
+            # values needn't be the same types as ours - or parents would be cached as having no records
+            positions = [ fieldlist.index( c ) for c in key_columns ]
+            grouped = { key: [] for key in wanted }
+            for record in records:
+                key = comparable_key( record[ p ] for p in positions )
+                if key in grouped:
+                    grouped[ key ].append( tuple( record ) )
+            for key , child_records in grouped.items():
+                key_tuple , parent_key , signature = wanted[ key ]
+                self.child_cache.put( parent_key , signature , fieldlist , column_info , child_records )
+
+        keys_dicts , self.prefetch_pending = self.prefetch_pending , None
+        if keys_dicts:
+            self.prefetch_for_parents( keys_dicts )
+
+        return False
+
+    def invalidate_cached_results( self , rows ):
+
+        # Called before we apply, while the rows still have their original values. Our own cached result set
+        # for the current parent is about to be stale, as are any our children have for these rows
+        if self.child_cache and self.parent_key is not None:
+            self.child_cache.invalidate( self.parent_key )
+        self.invalidate_child_caches( rows )
+
+    def store_in_child_cache( self ):
+
+        # We've just queried, so the model holds exactly what the database gave us
+        if self.child_cache and self.parent_key is not None:
+            self.child_cache.put(
+                self.parent_key
+              , self.last_query_signature
+              , self.fieldlist
+              , self.column_info
+              , [ tuple( row.__dict__[ a ] for a in row._attributes ) for row in self.model ]
+            )
+
+    def can_refresh( self ):
+
+        """An incremental refresh needs an existing ( un-paged ) model, and primary keys to match rows on"""
+
+        return self.widget_setup \
+           and isinstance( self.model , Gio.ListStore ) \
+           and self.primary_keys \
+           and all( k in self.fieldlist for k in self.primary_keys )
+
+    def refresh( self , *args ):
+
+        """Re-runs the current query, and applies only the differences to the model. Rows with outstanding
+           changes are left alone - even if they've gone from the database, in which case we warn the user.
+           Falls back to a full query if we can't match rows by primary key"""
+
+        if not self.can_refresh():
+            return self.query()
+
+        return self._do_refresh( keep_changes = True )
+
+    def _do_refresh( self , keep_changes=False ):
+
+        """Fetches the result set, and diffs it against the current model by primary key. New rows are
+           inserted, missing rows are removed, and changed values are written into the existing GridRows,
+           so selection + scroll position survive, and unchanged rows emit no notify signals at all.
+           Without keep_changes, outstanding changes are dropped - query() only gets us here once they've been
+           applied, or the caller has asked for them to be discarded"""
+
+        old_fieldlist = self.fieldlist
+        cursor = super()._do_query()
+        if not cursor:
+            return False
+
+        if self.fieldlist != old_fieldlist:
+            self.current_track = None
+            self.setup_datasheet_widget( cursor )
+            return True
+
+        key_positions = [ self.fieldlist.index( k ) for k in self.primary_keys ]
+        current_rows = list( self.model )
+        existing = {}
+        next_track = 0
+        for row in current_rows:
+            next_track = max( next_track , row.track() + 1 )
+            if row.row_state != INSERTED:
+                existing[ tuple( row.get_original_value( k ) for k in self.primary_keys ) ] = row
+
+        new_rows = []
+        for record in cursor.fetchall():
+            row = existing.pop( tuple( record[ i ] for i in key_positions ) , None )
+            if row is None:
+                row = self.grid_row_class( next_track , record , self.change_tracker )
+                next_track = next_track + 1
+            elif not keep_changes or row.row_state in ( UNCHANGED , LOCKED ):
+                row.refresh_values( record )
+            new_rows.append( row )
+
+        orphaned = []
+        if keep_changes:
+            # Rows inserted locally ( and not applied yet ) stay at the end, as do rows with edits that have
+            # gone from the database. Rows marked for deletion that have gone are already where they should be
+            orphaned = [ row for row in existing.values() if row.row_state == CHANGED ]
+            new_rows.extend( orphaned )
+            new_rows.extend( row for row in current_rows if row.row_state == INSERTED )
+            for row in orphaned:
+                del existing[ tuple( row.get_original_value( k ) for k in self.primary_keys ) ]
+
+        # Whatever's left has gone from the database ( as have local inserts, unless we're keeping changes )
+        for row in existing.values():
+            self.change_tracker.discard( row )
+        if not keep_changes:
+            for row in current_rows:
+                if row.row_state == INSERTED:
+                    self.change_tracker.discard( row )
+
+        self.splice_rows_into_model( current_rows , new_rows )
+
+        if orphaned:
+            self.dialog(
+                title="Edited records have gone!"
+              , type="warning"
+              , text="{0} record(s) you've edited in {1} have been deleted in the database ( or no longer match the query ).\n"
+                     "They've been kept, but applying changes to them won't update anything - undo them, or copy"
+                     " your changes elsewhere".format( len( orphaned ) , self.friendly_table_name )
+            )
+
+        if self.after_query:
+            self.after_query()
+
+        return True
+
+    def splice_rows_into_model( self , current_rows , new_rows ):
+
+        """Transforms the model from current_rows into new_rows with as few splice() calls as we can"""
+
+        model = self.model
+        selection = self.datasheet.single_selection
+        selected = selection.get_selected_item()
+        keep = set( id( row ) for row in new_rows )
+
+        # Remove contiguous runs of rows that have gone, working backwards so positions stay valid
+        position = len( current_rows )
+        while position > 0:
+            position = position - 1
+            if id( current_rows[ position ] ) in keep:
+                continue
+            end = position + 1
+            while position > 0 and id( current_rows[ position - 1 ] ) not in keep:
+                position = position - 1
+            model.splice( position , end - position , [] )
+
+        retained = [ id( row ) for row in current_rows if id( row ) in keep ]
+        old_ids = set( id( row ) for row in current_rows )
+
+        if [ id( row ) for row in new_rows if id( row ) in old_ids ] == retained:
+            # Retained rows are still in the same order, so we only need to insert the new ones
+            position = 0
+            while position < len( new_rows ):
+                if id( new_rows[ position ] ) in old_ids:
+                    position = position + 1
+                    continue
+                end = position
+                while end < len( new_rows ) and id( new_rows[ end ] ) not in old_ids:
+                    end = end + 1
+                model.splice( position , 0 , new_rows[ position:end ] )
+                position = end
+        else:
+            # The order changed. We still reuse the existing GridRow objects
+            model.splice( 0 , len( model ) , new_rows )
+
+        if selected is not None and id( selected ) in keep:
+            selection.set_selected( [ id( row ) for row in new_rows ].index( id( selected ) ) )
+
+    def setup_datasheet_widget( self , data , model=None ):
+
+        """If the columns haven't changed since the last query, we keep the existing DatasheetWidget
+           ( and its ColumnView, columns and factories ) and only swap in a new model"""
+
+        column_signature = tuple( ( d['name'] , d['type'] ) for d in self.fields )
+
+        if self.datasheet and self.datasheet.column_signature() == column_signature:
+            self.datasheet.set_data( data , model = model )
+        else:
+            if self.datasheet:
+                self.box.remove( self.datasheet )
+            self.datasheet = DatasheetWidget( self.fields , data , self.drop_downs , model = model )
+            self.box.prepend( self.datasheet )
+            self.row_select_signal = self.datasheet.cv.get_model().connect( 'selection-changed' , self.selection_changed_handler )
 
         """We need these back at this level, and not in the DatasheetWidget, for things to work in a generic way"""
         self.grid_row_class = self.datasheet.grid_row_class
         self.model = self.datasheet.model
-        self.box.prepend( self.datasheet )
+        self.change_tracker = self.datasheet.change_tracker
+        self.change_tracker.on_change = self.change_counts_changed
+        self.change_counts_changed( self.change_tracker )
         self.widget_setup = True
-        self.row_select_signal = self.datasheet.cv.get_model().connect( 'selection-changed' , self.selection_changed_handler )
 
         """As the datasheet is already populated at this point we've missed the 1st selection-changed signal,
            so we trigger it now"""
         self.selection_changed_handler( self.datasheet.single_selection , 0 , 1 )
 
+    def _do_async_query( self ):
+
+        """Runs the query on a worker thread, with its own connection ( from query_connection_factory ).
+           Rows are streamed back to the main thread in batches, via GLib.idle_add()"""
+
+        sql = self._prepare_query_sql()
+        generation = self.query_generation
+        self.query_running = True
+        self.set_loading_status( 0 )
+
+        worker = threading.Thread(
+            target = self._async_query_worker
+          , args = ( generation , sql , list( self.sql['bind_values'] ) )
+          , daemon = True
+        )
+        worker.start()
+
+        return True
+
+    def _async_query_worker( self , generation , sql , bind_values ):
+
+        # Nothing in here may touch Gtk - everything goes back to the main thread via GLib.idle_add()
+        connection = None
+        try:
+            connection = self.query_connection_factory()
+            self.async_query_connection = connection
+            cursor = connection.cursor()
+            execution_time = self.execute_in_worker( cursor , sql , bind_values )
+            GLib.idle_add( self._async_query_started , generation , DescribedCursor( cursor.description ) , execution_time )
+            while generation == self.query_generation:
+                records = cursor.fetchmany( self.async_batch_size )
+                if not records:
+                    break
+                GLib.idle_add( self._async_query_batch , generation , records )
+            GLib.idle_add( self._async_query_finished , generation , None , sql )
+        except Exception as e:
+            GLib.idle_add( self._async_query_finished , generation , e , sql )
+        finally:
+            if connection:
+                if self.async_query_connection is connection:
+                    self.async_query_connection = None
+                connection.close()
+
+    def execute_in_worker( self , cursor , sql , bind_values ):
+
+        """Like execute(), for worker threads: nothing on self is touched. Returns the execution time ( ms )"""
+
+        start_time = time.time()
+        if len( bind_values ) == 0:
+            cursor.execute( sql )
+        else:
+            cursor.execute( sql , bind_values )
+        return round( ( time.time() - start_time ) * 1000 )
+
+    def cancel_running_query( self ):
+
+        """Stops a background query that's still running. Its results would be ignored anyway
+           ( see query_generation ), but cancelling it saves the database and the network the work"""
+
+        if not self.query_running:
+            return
+        self.query_generation = self.query_generation + 1
+        self.query_running = False
+        self.set_loading_status( None )
+        connection = self.async_query_connection
+        if connection:
+            try:
+                self._db_cancel_query( connection )
+            except Exception as e:
+                print( "Couldn't cancel query: {0}".format( e ) )
+
+    def _async_query_started( self , generation , described_cursor , execution_time ):
+
+        if generation != self.query_generation:
+            return False
+
+        # fetch_column_info() may look things up on self.connection, so it only runs here, on the main thread
+        self.last_execution_time = execution_time
+        self.fieldlist = self.column_names_from_cursor( described_cursor )
+        self.column_info = self.apply_table_schema( self.fetch_column_info( described_cursor ) )
+        self.new_where_dict = {}
+
+        if not self.setup_fields():
+            return False
+
+        self.setup_all_drop_downs()
+        self.setup_datasheet_widget( [] )
+
+        return False
+
+    def _async_query_batch( self , generation , records ):
+
+        if generation != self.query_generation or not self.datasheet:
+            return False
+
+        first_batch = not len( self.model )
+        self.append_records_to_model( self.model , records )
+        self.set_loading_status( len( self.model ) )
+
+        if first_batch:
+            self.selection_changed_handler( self.datasheet.single_selection , 0 , 1 )
+
+        return False
+
+    def _async_query_finished( self , generation , error , sql ):
+
+        if generation != self.query_generation:
+            return False
+
+        self.query_running = False
+        self.set_loading_status( None )
+
+        if error:
+            print( "Oh nos! {0}".format( error ) )
+            if self.dump_on_error:
+                print ( "SQL was:\n{0}".format( sql ) )
+            return False
+
+        self.store_in_child_cache()
+
         if self.after_query:
             self.after_query()
 
-        return True
+        if self.on_query:
+            self.on_query()
+
+        return False
+
+    def change_counts_changed( self , tracker ):
+
+        # Rows can change state thousands of times in 1 go ( eg apply ), so we only update the label when idle
+        if self.change_counts_label and not self.change_counts_source_id:
+            self.change_counts_source_id = GLib.idle_add( self.update_change_counts_label )
+
+    def update_change_counts_label( self ):
+
+        self.change_counts_source_id = None
+        if self.change_counts_label and self.change_tracker:
+            summary = self.change_tracker.summary()
+            self.change_counts_label.set_text( summary )
+            self.change_counts_label.set_visible( bool( summary ) )
+        return False
+
+    def set_loading_status( self , row_count ):
+
+        """Shows 'loading N rows ...' in the recordset toolbar while an async query is running.
+           Pass None to hide it again"""
+
+        if not self.loading_label:
+            return
+        if row_count is None:
+            self.loading_label.set_visible( False )
+        else:
+            self.loading_label.set_text( "loading {0} rows…".format( row_count ) )
+            self.loading_label.set_visible( True )
 
     def apply( self , *args ):
 
@@ -2119,24 +4520,45 @@ class Gtk4DbDatasheet( Gtk4DbAbstract ):
             )
             return False
 
-        row_numbers_to_delete = []
-        row_number = -1
-        model = self.datasheet.cv.get_model()
+        if self.batch_apply:
+            return self.apply_batched()
 
-        for row in model:
-            if not row: # Happens when we delete rows
-                continue
-            row_number = row_number + 1
+        dirty_rows = self.change_tracker.dirty_rows()
+        self.invalidate_cached_results( dirty_rows )
+
+        # Deletes go 1st, in bulk, so re-inserted keys don't collide with the rows they replace
+        deletes = []
+        for row in dirty_rows:
+            if row.row_state == DELETED:
+                primary_keys = { k: row.get_value( k ) for k in self.primary_keys }
+                # If the user-defined before_apply() function returns False, we skip this row
+                if self.before_apply and not self.before_apply( status = "deleted" , primary_keys = primary_keys , grid_row = row ):
+                    continue
+                deletes.append( ( row , primary_keys ) )
+
+        if deletes:
+            if not self._do_delete_rows( [ row for row , primary_keys in deletes ] ):
+                return False
+            # If we removed rows while in a for loop of the model, very strange things happen ...
+            self.remove_rows( [ row for row , primary_keys in deletes ] )
+            for fkb in self.child_foreign_key_binders:
+                self.sync_grid_row_to_foreign_key_binding( self.get_current_grid_row() , fkb )
+            if self.on_apply:
+                for row , primary_keys in deletes:
+                    self.on_apply( state = "deleted" , primary_keys = primary_keys , grid_row = row )
+
+        # Only rows with outstanding changes are visited
+        for row in dirty_rows:
             state = row.row_state
             # Decide what to do based on status
-            if state == UNCHANGED or state == LOCKED:
+            if state == UNCHANGED or state == LOCKED or state == DELETED:
                 continue
 
             # Now assemble a hash of primary key items and values.
             # This gets passed to any before_apply() and after_apply() handlers.
             primary_keys = {}
             for primary_key_item in self.primary_keys:
-                primary_keys[ primary_key_item ] = getattr( row , primary_key_item )
+                primary_keys[ primary_key_item ] = row.get_value( primary_key_item )
 
             if self.before_apply:
                 # Better change the state indicator back into text, rather than make
@@ -2146,8 +4568,6 @@ class Gtk4DbDatasheet( Gtk4DbAbstract ):
                     state_txt     = "inserted"
                 elif state       == CHANGED:
                     state_txt     = "changed"
-                elif state       == DELETED:
-                    state_txt     = "deleted"
                 # Do people want the whole row? I don't. Maybe others would? Wait for requests...
                 result = self.before_apply(
                     status=state_txt
@@ -2158,12 +4578,7 @@ class Gtk4DbDatasheet( Gtk4DbAbstract ):
                 # update and continue with the next
                 if not result:
                     continue
-            if state == DELETED:
-                if not self._do_delete( row=row ):
-                    return False
-                # If we removed rows while in a for loop of the model, very strange things happen ...
-                row_numbers_to_delete.append( row_number )
-            elif state == INSERTED: # We process the insert / update operations in a similar fashion
+            if state == INSERTED: # We process the insert / update operations in a similar fashion
                 if not self._do_insert( row=row ):
                     return False
             elif state == CHANGED:
@@ -2182,20 +4597,143 @@ class Gtk4DbDatasheet( Gtk4DbAbstract ):
                     state_txt     = "inserted"
                 elif state       == CHANGED:
                     state_txt    = "changed"
-                elif state       == DELETED:
-                    state_txt     = "deleted"
                 self.on_apply(
                     state=state_txt
                   , primary_keys=primary_keys
                   , grid_row=row
                 )
 
-        if len( row_numbers_to_delete ):
-            # Each time we remove an item, we have to subtract 1 from the remaining indices
-            removed = 0
-            for i in row_numbers_to_delete:
-                model.get_model().remove( i - removed )
-                removed = removed + 1
+        return True
+
+    def apply_batched( self ):
+
+        """Applies all outstanding changes in a single transaction. Rows are grouped by their statement
+           ( ie the operation and the set of changed columns ), and each group is sent with executemany().
+           If anything fails, everything is rolled back and the model is left as it was"""
+
+        pending = []
+        for row in self.change_tracker.dirty_rows():
+            if row.row_state == EMPTY:
+                continue
+            state = row.row_state
+            primary_keys = { k: row.get_value( k ) for k in self.primary_keys }
+            if self.before_apply:
+                # If the user-defined before_apply() function returns False, we skip this row
+                if not self.before_apply( status = self.state_to_text( state ) , primary_keys = primary_keys , grid_row = row ):
+                    continue
+            pending.append( ( row , state , primary_keys ) )
+
+        if not pending:
+            return True
+
+        self.invalidate_cached_results( [ row for row , state , primary_keys in pending ] )
+
+        # Deletes go 1st, so re-inserted keys don't collide with the rows they replace
+        deleted_rows = []
+        updates = collections.OrderedDict()
+        inserts = collections.OrderedDict()
+        keyed_inserts = [] # inserts where we need to capture a generated key
+        single_rows = [] # rows we send 1 at a time, as we need to capture server values
+        executed = [] # the ( sql , values , mog_values ) we actually run, in order, for sql_executions_callback
+
+        for row , state , primary_keys in pending:
+            if state == DELETED:
+                deleted_rows.append( row )
+                continue
+            elif state == INSERTED:
+                statement = self._insert_statement( row )
+                group = inserts
+            else:
+                statement = self._update_statement( row )
+                group = updates
+            if statement is None:
+                continue
+            sql , values , mog_values = statement
+            if state == INSERTED and self.auto_incrementing:
+                keyed_inserts.append( ( row , sql , values , mog_values ) )
+            elif self.write_back_server_values and state != DELETED:
+                single_rows.append( ( row , state , sql , values , mog_values ) )
+            else:
+                group.setdefault( sql , [] ).append( ( values , mog_values ) )
+
+        cursor = self.connection.cursor()
+        transaction = None
+        server_values = []
+        sql = None
+
+        try:
+            transaction = self._db_begin_transaction( cursor )
+            if deleted_rows:
+                executed.extend( self._bulk_delete( cursor , deleted_rows ) )
+            for group in ( updates , inserts ):
+                for sql , statements in group.items():
+                    values_list = [ values for values , mog_values in statements ]
+                    if group is inserts and self._db_copy_insert( cursor , values_list , executed ) is not None:
+                        continue
+                    self.executemany( cursor , sql , values_list )
+                    executed.extend( ( sql , values , mog_values ) for values , mog_values in statements )
+            if len( keyed_inserts ) > 1:
+                # _db_bulk_insert() matches what the database returns back to the rows we pass in
+                returned = self._db_bulk_insert(
+                    cursor
+                  , [ values for row , sql , values , mog_values in keyed_inserts ]
+                  , executed
+                  , [ mog_values for row , sql , values , mog_values in keyed_inserts ]
+                )
+                if returned is not None:
+                    server_values.extend( zip( [ row for row , sql , values , mog_values in keyed_inserts ] , returned ) )
+                    keyed_inserts = []
+            for row , sql , values , mog_values in keyed_inserts:
+                self.execute( cursor , sql , values , prepare=True )
+                executed.append( ( sql , values , mog_values ) )
+                if self.write_back_server_values:
+                    server_values.append( ( row , self.fetch_server_values( cursor , row , INSERTED ) ) )
+                else:
+                    server_values.append( ( row , { k: self.last_insert_id( cursor ) for k in self.primary_keys } ) )
+            for row , state , sql , values , mog_values in single_rows:
+                self.execute( cursor , sql , values , prepare=True )
+                executed.append( ( sql , values , mog_values ) )
+                server_values.append( ( row , self.fetch_server_values( cursor , row , state ) ) )
+            self._db_end_transaction( cursor , transaction )
+        except Exception as e:
+            try:
+                self._db_end_transaction( cursor , transaction , commit = False )
+            except Exception as rollback_error:
+                print( "Rollback failed: {0}".format( rollback_error ) )
+            self.dialog(
+                title="Error applying changes!"
+              , type="error"
+              , markup="<b>Database server says:</b>\n\n{0}\n\nAll changes have been rolled back".format( GLib.markup_escape_text( str( e ) ) )
+            )
+            if self.dump_on_error:
+                print ( "SQL was:\n{0}".format( sql ) )
+            return False
+
+        if self.sql_executions_callback:
+            for sql , values , mog_values in executed:
+                mog_sql = self.mogrify( cursor=cursor , sql=sql , bind_values=values , mog_values=mog_values )
+                self.sql_executions_callback( table=self.friendly_table_name , sql=sql , bind_values=values , mog_sql=mog_sql , mog_values=mog_values )
+
+        # Only now that everything has been committed do we touch the model
+        for row , values in server_values:
+            row.write_back( values )
+
+        for row , state , primary_keys in pending:
+            if state != DELETED:
+                self._set_record_unchanged( row=row )
+
+        self.remove_rows( deleted_rows )
+
+        for fkb in self.child_foreign_key_binders:
+            self.sync_grid_row_to_foreign_key_binding( self.get_current_grid_row() , fkb )
+
+        if self.on_apply:
+            for row , state , primary_keys in pending:
+                self.on_apply(
+                    state=self.state_to_text( state )
+                  , primary_keys=primary_keys
+                  , grid_row=row
+                )
 
         return True
 
@@ -2216,7 +4754,9 @@ class Gtk4DbDatasheet( Gtk4DbAbstract ):
         # single_selection = self.datasheet.cv.get_model()
         position = self.datasheet.single_selection.get_selected()
         grid_row = self.datasheet.single_selection[ position ]
+        old_state = grid_row.row_state
         grid_row.row_state = DELETED
+        self.change_tracker.record( 'state' , grid_row , old_state = old_state )
 
     def lock( self , *args ):
 
@@ -2242,32 +4782,63 @@ class Gtk4DbDatasheet( Gtk4DbAbstract ):
 
     def any_changes( self ):
 
-        model = self.datasheet.cv.get_model()
-        for row in model:
-            state = row.row_state
-            if state != UNCHANGED and state != LOCKED:
-                return True
-        return False
+        return self.change_tracker is not None and self.change_tracker.any_changes()
+
+    def column_values( self , column , conditions=None ):
+
+        """Returns the non-NULL values in a column ( by name or number ), optionally only from rows where
+           each column in the conditions dict matches the given value. Deleted rows are skipped"""
 
-    def sum_column( self , column_no, conditions ):
+        if not isinstance( column , str ):
+            column = self.fields[ column ]['name']
+        values = []
+        for position , row in self.rows_with_positions():
+            if row.row_state == DELETED:
+                continue
+            if conditions and any( row.get_value( k ) != v for k , v in conditions.items() ):
+                continue
+            value = row.get_value( column )
+            if value is not None:
+                values.append( value )
+        return values
+
+    def numeric_column_values( self , column , conditions=None ):
+
+        # Typed columns are already numbers. Text we parse like an entry's, and skip if we can't
+        values = []
+        for v in self.column_values( column , conditions ):
+            if isinstance( v , str ):
+                try:
+                    v = parse_grid_value( 'float' , v )
+                except ValueError:
+                    continue
+            elif not isinstance( v , ( int , float ) ):
+                v = float( v ) # eg a Decimal from a numeric column
+            if v is not None:
+                values.append( v )
+        return values
+
+    def sum_column( self , column_no , conditions=None ):
 
         # This function returns the sum of all values in the given column
-        print( "sum_column() not implemented!" )
+        return sum( self.numeric_column_values( column_no , conditions ) )
 
     def max_column( self , column_no ):
 
         # This function returns the MAXIMUM value in a given column
-        print( "max_column() not implemented!" )
+        values = self.numeric_column_values( column_no )
+        return max( values ) if values else None
 
     def average_column( self , column_no ):
 
         # This function returns the AVERAGE value in a given column
-        print( "average_column() not implemented!" )
+        values = self.numeric_column_values( column_no )
+        return sum( values ) / len( values ) if values else None
 
-    def count( self , column_no , conditions ):
+    def count( self , column_no , conditions=None ):
 
         # This function returns the number of all records ( optionally where $column_no matches $conditions )
-        print( "count() not implemented!" )
+        return len( self.column_values( column_no , conditions ) )
 
 
 ##############################################################################################################
@@ -2309,7 +4880,8 @@ class Gtk4DbForm( Gtk4DbAbstract ):
                   , recordset_tools_box=None , recordset_items=None , quiet=False, widget_prefix=None
                   , css_provider=None , before_insert=False , on_insert=False , on_row_select=None , on_query=None
                   , drop_downs={} , sql_executions_callback=None , mogrify_column_callbacks={}
-                  , copy_transform_callback=None , paste_transform_callback=None , primary_keys=None , **kwargs ):
+                  , copy_transform_callback=None , paste_transform_callback=None , primary_keys=None
+                  , schema_cache_key=None , write_back_server_values=False , **kwargs ):
 
         if recordset_items is None:
             recordset_items = [ "status" , "spinner" , "insert" , "copy" , "paste" , "undo" , "delete" , "apply" ]
@@ -2368,6 +4940,7 @@ class Gtk4DbForm( Gtk4DbAbstract ):
         self.css_provider = css_provider
         self.model_to_widget_bindings = {}
         self.drop_down_models = {}
+        self.drop_down_factories = {}
         self.child_foreign_key_binders = []
         self.foreign_key_binder = None
         self.drop_downs = drop_downs
@@ -2378,6 +4951,8 @@ class Gtk4DbForm( Gtk4DbAbstract ):
         self.copy_transform_callback = copy_transform_callback
         self.paste_transform_callback = paste_transform_callback
         self.recordset_tools_dict = {}
+        self.schema_cache_key = schema_cache_key
+        self.write_back_server_values = write_back_server_values
 
         self.setup_shared_mem_db()
 
@@ -2410,8 +4985,6 @@ class Gtk4DbForm( Gtk4DbAbstract ):
         if self.recordset_tools_box:
             self.setup_recordset_tools()
 
-        self.setup_all_drop_downs()
-
         if not self.query():
             return
 
@@ -2428,14 +5001,18 @@ class Gtk4DbForm( Gtk4DbAbstract ):
         # self.drop_downs is a dictionary, with keys being column names, and values being a dictionary
         # defining some sql and bind values to set up the drop down
         for drop_down in self.drop_downs:
-            self.setup_drop_down( drop_down , self.drop_downs[ drop_down ][ 'sql' ] , self.drop_downs[ drop_down ][ 'bind_values' ] )
+            self.setup_drop_down( drop_down , self.drop_downs[ drop_down ][ 'sql' ] , self.drop_downs[ drop_down ][ 'bind_values' ]
+                                , self.drop_downs[ drop_down ].get( 'ttl' ) )
 
-    def setup_drop_down( self , column_name , sql , bind_values ):
+    def setup_drop_down( self , column_name , sql , bind_values , ttl=None ):
 
-        factory , model = self.setup_drop_down_factory_and_model( sql , bind_values )
+        model = self.drop_down_model( sql , bind_values , ttl )
         drop_down = self.get_widget( column_name )
-        drop_down.set_factory( factory )
-        drop_down.set_model( model )
+        if column_name not in self.drop_down_factories:
+            self.drop_down_factories[ column_name ] = self.make_drop_down_factory()
+            drop_down.set_factory( self.drop_down_factories[ column_name ] )
+        if drop_down.get_model() is not model:
+            drop_down.set_model( model )
         self.drop_down_models[ column_name ] = model
 
     def get_widget( self , column_name , missing_is_fatal = True ):
@@ -2462,11 +5039,11 @@ class Gtk4DbForm( Gtk4DbAbstract ):
 
     def get( self , column_name ):
 
-        return getattr( self.model[ self.position ] , column_name )
+        return self.model[ self.position ].get_value( column_name )
 
     def set( self , column_name , value ):
 
-        setattr( self.model[ self.position ] , column_name , value )
+        self.model[ self.position ].set_value( column_name , value )
 
     def _do_query( self ):
 
@@ -2510,6 +5087,7 @@ class Gtk4DbForm( Gtk4DbAbstract ):
 
         for fkb in self.child_foreign_key_binders:
             self.sync_grid_row_to_foreign_key_binding( self.get_current_grid_row() , fkb )
+        self.prefetch_children( self.position )
 
         if self.on_row_select:
             self.on_row_select( self.get_current_grid_row() )
@@ -2518,7 +5096,12 @@ class Gtk4DbForm( Gtk4DbAbstract ):
     def undo( self , *args ):
 
         super().undo( *args )
+        # If we've undone an insert, the row we were on might be gone
+        if self.position >= len( self.model ):
+            self.position = max( len( self.model ) - 1 , 0 )
         self.set_spinner_range() # If we're undoing an insert, we need this
+        if len( self.model ):
+            self.bind_model_to_widgets()
 
     def bind_model_to_widgets( self ):
 
@@ -2568,7 +5151,7 @@ class Gtk4DbForm( Gtk4DbAbstract ):
                     users will have to click each such widget ( which will set the value to True ) and
                     then click it again ( which will set the value to False ). This is a horrible user
                     experience. So it's best to just force to False if it's currently NULL."""
-                    if getattr( this_grid_row , column_name ) is None:
+                    if this_grid_row.get_value( column_name ) is None:
                         """
                         We *also* have to ensure we don't change the row_state, as it could be *either*
                         UNCHANGED ( if we're populating with an actual record ) or EMPTY if the query
@@ -2576,7 +5159,7 @@ class Gtk4DbForm( Gtk4DbAbstract ):
                         row_state, this will trigger our "do you want to apply the current record" dialog
                         if this object is requeried, even if the user hasn't done anything with the record"""
                         row_state = getattr( this_grid_row , "row_state" )
-                        setattr( this_grid_row , column_name , False )
+                        this_grid_row.set_value( column_name , False )
                         setattr( this_grid_row , "row_state" , row_state )
                     self.model_to_widget_bindings[ column_name ] = this_grid_row.bind_property(
                                                                        column_name , widget , "active"
@@ -2584,6 +5167,14 @@ class Gtk4DbForm( Gtk4DbAbstract ):
                                                                      | GObject.BindingFlags.SYNC_CREATE
                                                                      , self.bind_checkbutton_transform_to
                                                                    )
+                elif column_name in this_grid_row._kinds.keys():
+                    self.model_to_widget_bindings[ column_name ] = this_grid_row.bind_property(
+                                                                       this_grid_row.native_property( column_name ) , widget , "text"
+                                                                     , GObject.BindingFlags.BIDIRECTIONAL
+                                                                     | GObject.BindingFlags.SYNC_CREATE
+                                                                     , self.bind_number_transform_to
+                                                                     , self.bind_number_transform_from
+                                                                     , column_name )
                 else:
                     self.model_to_widget_bindings[ column_name ] = this_grid_row.bind_property(
                                                                        column_name , widget , "text"
@@ -2610,7 +5201,10 @@ class Gtk4DbForm( Gtk4DbAbstract ):
         if notify_topic != 'row-state':
             # Assume the topic is a column name at this point
             notify_topic = notify_topic.replace( '-' , '_' )
-            current_value = getattr( grid_row , notify_topic )
+            if notify_topic not in grid_row._kinds and notify_topic.endswith( NATIVE_PROPERTY_SUFFIX ):
+                # A typed column's native property, which notifies along with the column itself
+                return
+            current_value = grid_row.get_value( notify_topic )
             self.highlight_null( notify_topic )
 
     def highlight_null( self , column ):
@@ -2650,11 +5244,13 @@ class Gtk4DbForm( Gtk4DbAbstract ):
         if state == UNCHANGED or state == LOCKED:
             return True
 
+        self.invalidate_child_caches( [ row ] )
+
         # Now assemble a hash of primary key items and values.
         # This gets passed to any before_apply() and after_apply() handlers.
         primary_keys = {}
         for primary_key_item in self.primary_keys:
-            primary_keys[ primary_key_item ] = getattr( row , primary_key_item )
+            primary_keys[ primary_key_item ] = row.get_value( primary_key_item )
 
         if self.before_apply:
             # Better change the state indicator back into text, rather than make
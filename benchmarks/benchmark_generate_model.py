@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Compares building a model row by row ( the old generate_model() ) with the batched
+fetchmany() + splice() build, on:
+  - the 1,200 row addresses table from example_app/main.py
+  - a synthetic 500,000 row SQLite table
+
+Usage: python benchmarks/benchmark_generate_model.py [ synthetic row count ]
+
+Only the model build is timed. With a ColumnView attached to the model, every items-changed
+signal also costs a re-layout, so the difference on screen is bigger than what's shown here.
+"""
+
+import os , sqlite3 , sys , time
+
+sys.path.insert( 0 , os.path.join( os.path.dirname( os.path.abspath( __file__ ) ) , '..' ) )
+
+from Gtk4DbBinder.Gtk4DbBinder import Gtk4DbAbstract , Gio
+
+ADDRESSES = [
+    ( 1 , 'Parramatta Road' , None , 'Granville' , 1 , 'Australia' , 2142 )
+  , ( 1 , 'Parramatta Road' , None , 'Auburn' , 1 , 'Australia' , None )
+  , ( 2 , 'HPPL House', '28-42 Ventnor Avenue' , 'West Perth' , 2 , 'Australia' , 6005 )
+  , ( 3 , 'P.O.Box 549' , 'KY1-1602, Corner of Mary Street and Sheddon Road' , 'Grand Cayman' , 3 , 'Cayman Islands' , 'KY1-1602' )
+  , ( 4 , 'Hillsong Convention Centre' , '1 Solent Cct' , 'Norwest' , 1 , 'Australia' , 2153 )
+  , ( 5 , '2 Holt Street' , None , 'Surry Hills' , 1 , 'Australia' , 2010 )
+]
+
+def create_addresses( connection , table , copies ):
+
+    # The same table + data as example_app/main.py creates
+    connection.execute( """
+        create table {0} (
+            id                  integer           primary key
+          , customer_id         int    not null
+          , address_line_1      text
+          , address_line_2      text
+          , city                text
+          , state               int
+          , country             text
+          , postcode            text
+        )""".format( table ) )
+    connection.executemany(
+        """insert into {0} ( customer_id, address_line_1 , address_line_2 , city, state,country, postcode )
+               values ( ? , ? , ? , ? , ? , ? , ? )""".format( table )
+      , ADDRESSES * copies )
+
+def build_row_by_row( binder , definitions , cursor ):
+
+    grid_row_class = binder.generate_grid_row_class( definitions )
+    model = Gio.ListStore.new( grid_row_class )
+    for track , record in enumerate( cursor ):
+        model.append( grid_row_class( track , record ) )
+    return model
+
+def build_batched( binder , definitions , cursor ):
+
+    return binder.generate_model( definitions , cursor )
+
+def best_of( runs , build , binder , connection , table ):
+
+    best = None
+    for i in range( runs ):
+        cursor = connection.execute( "select * from {0}".format( table ) )
+        definitions = [ { 'name': d[0] } for d in cursor.description ]
+        start = time.perf_counter()
+        model = build( binder , definitions , cursor )
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min( best , elapsed )
+    return best , len( model )
+
+def main():
+
+    synthetic_rows = int( sys.argv[1] ) if len( sys.argv ) > 1 else 500000
+    connection = sqlite3.connect( ":memory:" )
+    create_addresses( connection , "addresses" , 200 )
+    create_addresses( connection , "synthetic_addresses" , synthetic_rows // len( ADDRESSES ) )
+
+    binder = Gtk4DbAbstract.__new__( Gtk4DbAbstract )
+
+    for table , runs in ( ( "addresses" , 20 ) , ( "synthetic_addresses" , 3 ) ):
+        row_by_row , rows = best_of( runs , build_row_by_row , binder , connection , table )
+        batched , rows = best_of( runs , build_batched , binder , connection , table )
+        print( "{0:20} {1:>8} rows   row by row: {2:8.3f}s   batched: {3:8.3f}s   speed-up: {4:5.2f}x".format(
+            table , rows , row_by_row , batched , row_by_row / batched ) )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Shared fixtures. The binders need PyGObject and GTK 4, so each test module starts with
+pytest.importorskip( "gi" ), and nothing in here imports them until a fixture is used"""
+
+import pytest
+
+
+class FakeCursor:
+
+    """A DB API cursor over a list of records, which remembers the batch sizes fetchmany() was asked for"""
+
+    def __init__( self , records ):
+
+        self.records = list( records )
+        self.position = 0
+        self.batch_sizes = []
+
+    def fetchmany( self , size ):
+
+        self.batch_sizes.append( size )
+        batch = self.records[ self.position : self.position + size ]
+        self.position = self.position + len( batch )
+        return batch
+
+
+def bare_binder( binder_class=None ):
+
+    """Returns a binder that hasn't been through its constructor ( which wants a database and widgets ),
+       for testing methods that only need a few attributes. Tests set whatever else they need"""
+
+    if binder_class is None:
+        from Gtk4DbBinder.Gtk4DbBinder import Gtk4DbAbstract as binder_class
+    return binder_class.__new__( binder_class )
+
+
+def row_values( grid_row , column_names ):
+
+    # The values a GridRow was built with, as they're stored
+    return tuple( grid_row.__dict__[ '_' + name ] for name in column_names )
+
+
+@pytest.fixture
+def make_binder():
+
+    return bare_binder
+
+
+@pytest.fixture
+def fake_cursor():
+
+    return FakeCursor
+
+
+@pytest.fixture
+def values_of():
+
+    return row_values
@@ -0,0 +1,21 @@
+import datetime
+import decimal
+
+import pytest
+
+pytest.importorskip( "gi" )
+
+from Gtk4DbBinder.Gtk4DbBinder import comparable_key
+
+
+def test_keys_match_across_types():
+
+    assert comparable_key( ( 5 , ) ) == comparable_key( ( '5' , ) ) == comparable_key( ( decimal.Decimal( '5' ) , ) )
+    assert comparable_key( ( datetime.date( 2024 , 1 , 5 ) , 'A' ) ) == comparable_key( ( '2024-01-05' , 'A' ) )
+
+
+def test_different_keys_stay_different():
+
+    assert comparable_key( ( 5 , ) ) != comparable_key( ( 6 , ) )
+    assert comparable_key( ( 1.5 , ) ) != comparable_key( ( 1 , ) )
+    assert comparable_key( ( None , ) ) != comparable_key( ( 'None' , ) )
@@ -0,0 +1,62 @@
+import pytest
+
+pytest.importorskip( "gi" )
+
+from Gtk4DbBinder.Gtk4DbBinder import IndexedKeyValueModel , KeyValueModel
+
+
+COLUMN = 'business_type_id'
+
+
+@pytest.fixture
+def binder( make_binder ):
+
+    binder = make_binder()
+    binder.drop_downs = { COLUMN: { 'sql': "select id , business_type from business_types" , 'bind_values': [] } }
+    binder.fieldlist = [ 'id' , COLUMN ]
+    binder.column_name_to_number_mapping = { 'id': 0 , COLUMN: 1 }
+    binder.column_info = { 'id': { 'type': 'INTEGER' } , COLUMN: { 'type': 'INTEGER' } }
+
+    model = IndexedKeyValueModel()
+    model.splice( 0 , 0 , [ KeyValueModel( None , '< nothing selected >' ) , KeyValueModel( 3 , 'Retail' ) ] )
+    binder.drop_down_models = { COLUMN: model }
+    return binder
+
+
+def test_drop_down_columns_are_not_typed( binder ):
+
+    assert binder.column_kind( { 'name': 'id' , 'type': 'number' } ) == 'int'
+    assert binder.column_kind( { 'name': COLUMN , 'type': 'number' } ) == 'str'
+
+
+def test_null_round_trips_through_drop_down( binder ):
+
+    definitions = [ { 'name': name , 'kind': binder.column_kind( { 'name': name , 'type': 'number' } ) } for name in binder.fieldlist ]
+    grid_row = binder.grid_row_class_for( definitions )( 0 , [ 1 , None ] )
+
+    # NULL in the model selects '< nothing selected >'
+    assert binder.bind_dropdown_transform_to( None , grid_row.get_property( COLUMN ) , COLUMN ) == 0
+
+    grid_row.set_property( COLUMN , binder.bind_dropdown_transform_from( None , 1 , COLUMN ) )
+    assert str( grid_row.get_value( COLUMN ) ) == '3'
+    assert binder.bind_dropdown_transform_to( None , grid_row.get_property( COLUMN ) , COLUMN ) == 1
+
+    # ... and picking it again stores NULL
+    grid_row.set_property( COLUMN , binder.bind_dropdown_transform_from( None , 0 , COLUMN ) )
+    assert grid_row.get_value( COLUMN ) is None
+    assert binder.bind_dropdown_transform_to( None , grid_row.get_property( COLUMN ) , COLUMN ) == 0
+
+
+def test_typed_columns_keep_null_in_the_model( binder ):
+
+    definitions = [ { 'name': name , 'kind': binder.column_kind( { 'name': name , 'type': 'number' } ) } for name in binder.fieldlist ]
+    grid_row = binder.grid_row_class_for( definitions )( 0 , [ 1 , None ] )
+    native = grid_row.native_property( 'id' )
+
+    grid_row.set_property( native , None )
+    assert grid_row.get_value( 'id' ) is None
+    assert grid_row.get_property( 'id' ) == 0
+    assert binder.bind_number_transform_to( None , grid_row.get_property( native ) , 'id' ) == ''
+
+    grid_row.set_property( native , 42 )
+    assert grid_row.get_value( 'id' ) == 42
@@ -0,0 +1,54 @@
+import sqlite3
+
+import pytest
+
+pytest.importorskip( "gi" )
+
+from Gtk4DbBinder import Gtk4DbBinder as binder_module
+
+
+COLUMNS = [ 'id' , 'city' , 'postcode' ]
+DEFINITIONS = [ { 'name': name } for name in COLUMNS ]
+
+
+def test_batched_model_matches_records( make_binder , fake_cursor , values_of ):
+
+    records = [ ( i , "city {0}".format( i ) , str( 2000 + i % 100 ) ) for i in range( 20000 ) ]
+    cursor = fake_cursor( records )
+
+    model = make_binder().generate_model( DEFINITIONS , cursor )
+
+    assert [ values_of( grid_row , COLUMNS ) for grid_row in model ] == records
+    assert [ grid_row.track() for grid_row in model ] == list( range( len( records ) ) )
+    assert len( cursor.batch_sizes ) > 1
+    assert all( binder_module.MODEL_BATCH_MIN <= size <= binder_module.MODEL_BATCH_MAX for size in cursor.batch_sizes )
+
+
+def test_batched_model_matches_row_by_row_build( make_binder , values_of ):
+
+    connection = sqlite3.connect( ":memory:" )
+    connection.execute( "create table addresses ( id integer primary key , city text , postcode text )" )
+    connection.executemany( "insert into addresses ( city , postcode ) values ( ? , ? )" , [ ( "Granville" , "2142" ) , ( "Auburn" , None ) ] * 600 )
+    sql = "select id , city , postcode from addresses order by id"
+
+    binder = make_binder()
+    batched = binder.generate_model( DEFINITIONS , connection.execute( sql ) )
+
+    # The row-by-row build we replaced
+    grid_row_class = binder.generate_grid_row_class( DEFINITIONS )
+    appended = binder_module.Gio.ListStore.new( grid_row_class )
+    for track , record in enumerate( connection.execute( sql ) ):
+        appended.append( grid_row_class( track , record ) )
+
+    assert [ values_of( r , COLUMNS ) for r in batched ] == [ values_of( r , COLUMNS ) for r in appended ]
+
+
+def test_batch_size_adapts_within_limits( make_binder ):
+
+    binder = make_binder()
+    target = binder_module.MODEL_BATCH_TARGET_SECONDS
+
+    assert binder.adapt_batch_size( 1024 , 0 ) > 1024
+    assert binder.adapt_batch_size( 1024 , target * 10 ) < 1024
+    assert binder.adapt_batch_size( binder_module.MODEL_BATCH_MAX , 0 ) == binder_module.MODEL_BATCH_MAX
+    assert binder.adapt_batch_size( binder_module.MODEL_BATCH_MIN , target * 10 ) == binder_module.MODEL_BATCH_MIN
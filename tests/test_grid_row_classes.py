@@ -0,0 +1,64 @@
+import gc
+import glob
+import sys
+import tempfile
+import tracemalloc
+
+import pytest
+
+pytest.importorskip( "gi" )
+
+from Gtk4DbBinder.Gtk4DbBinder import Gtk4DbAbstract
+
+
+REQUERIES = 10000
+
+COLUMNS = [ 'id' , 'name' , 'credit_limit' ]
+DEFINITIONS = [ { 'name': name } for name in COLUMNS ]
+RECORDS = [ ( 1 , 'Acme' , 1000.0 ) , ( 2 , 'Initech' , None ) ]
+
+
+def test_requerying_reuses_grid_row_class( make_binder , fake_cursor ):
+
+    binder = make_binder()
+    temp_files = set( glob.glob( tempfile.gettempdir() + "/GridRow_*" ) )
+
+    def requery():
+        # What a query() does to our models: a fresh copy of the column definitions, and a new model
+        return binder.generate_model( [ dict( d ) for d in DEFINITIONS ] , fake_cursor( RECORDS ) )
+
+    model = requery()
+    grid_row_class = binder.grid_row_class
+    classes = len( Gtk4DbAbstract.grid_row_classes )
+    modules = len( sys.modules )
+
+    gc.collect()
+    tracemalloc.start()
+    before , peak = tracemalloc.get_traced_memory()
+
+    for i in range( REQUERIES ):
+        model = requery()
+        assert binder.grid_row_class is grid_row_class
+
+    del model
+    gc.collect()
+    after , peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # 1 class ( and GType ) per column signature, no matter how often we requery
+    assert len( Gtk4DbAbstract.grid_row_classes ) == classes
+    assert len( sys.modules ) == modules
+    assert set( glob.glob( tempfile.gettempdir() + "/GridRow_*" ) ) == temp_files
+    assert after - before < 1024 * 1024
+
+
+def test_grid_row_classes_are_keyed_by_column_signature( make_binder , values_of ):
+
+    binder = make_binder()
+    base = binder.generate_grid_row_class( DEFINITIONS )
+
+    assert binder.generate_grid_row_class( [ dict( d ) for d in DEFINITIONS ] ) is base
+    assert binder.generate_grid_row_class( DEFINITIONS[ :2 ] ) is not base
+
+    grid_row = base( 0 , RECORDS[1] )
+    assert values_of( grid_row , COLUMNS ) == RECORDS[1]
@@ -0,0 +1,31 @@
+import pytest
+
+pytest.importorskip( "gi" )
+
+from Gtk4DbBinder.Gtk4DbBinder import Gtk4MySQLAbstract , Gtk4PostgresAbstract , Gtk4SQLiteAbstract
+
+
+@pytest.mark.parametrize( "binder_class , declared , expected" , [
+    ( Gtk4PostgresAbstract , "timestamp without time zone" , "timestamp" )
+  , ( Gtk4PostgresAbstract , "timestamp(3) with time zone" , "text" )
+  , ( Gtk4PostgresAbstract , "date" , "date" )
+  , ( Gtk4PostgresAbstract , "point" , "text" )
+  , ( Gtk4PostgresAbstract , "interval" , "text" )
+  , ( Gtk4PostgresAbstract , "character varying(20)" , "text" )
+  , ( Gtk4PostgresAbstract , "numeric(10,2)" , "number" )
+  , ( Gtk4MySQLAbstract , "datetime" , "timestamp" )
+  , ( Gtk4MySQLAbstract , "int(10) unsigned" , "number" )
+  , ( Gtk4SQLiteAbstract , "DATETIME" , "timestamp" )
+  , ( Gtk4SQLiteAbstract , "blob" , "text" )
+] )
+def test_declared_types_map_to_renderer_types( make_binder , binder_class , declared , expected ):
+
+    assert make_binder( binder_class ).renderer_type( declared ) == expected
+
+
+def test_postgres_dates_are_cast_to_their_own_type( make_binder ):
+
+    binder = make_binder( Gtk4PostgresAbstract )
+
+    assert binder._db_prepare_value_fragment( { 'type': 'date' } , 'start_date' ) == "cast( nullif( cast( %s as text ) , '' ) as date )"
+    assert binder._db_prepare_value_fragment( { 'type': 'text' } , 'recorded_at' ) == "%s"
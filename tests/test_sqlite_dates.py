@@ -0,0 +1,61 @@
+import sqlite3
+
+import pytest
+
+pytest.importorskip( "gi" )
+
+from Gtk4DbBinder.Gtk4DbBinder import Gtk4SQLiteAbstract
+
+
+FIELDS = [
+    { 'name': 'id' , 'type': 'number' }
+  , { 'name': 'name' , 'type': 'text' }
+  , { 'name': 'contract_start_date' , 'type': 'date' }
+]
+
+
+@pytest.fixture
+def binder( make_binder ):
+
+    connection = sqlite3.connect( ":memory:" , isolation_level=None )
+    connection.execute( "create table customers ( id integer primary key autoincrement , name text , contract_start_date date )" )
+
+    binder = make_binder( Gtk4SQLiteAbstract )
+    binder.connection = connection
+    binder.sql = { 'select': '*' , 'from': 'customers' }
+    binder.fields = FIELDS
+    binder.fieldlist = [ f['name'] for f in FIELDS ]
+    binder.primary_keys = [ 'id' ]
+    binder.auto_incrementing = True
+    return binder
+
+
+def stored_dates( binder ):
+
+    return [ record[0] for record in binder.connection.execute( "select contract_start_date from customers order by id" ) ]
+
+
+def test_insert_round_trips_date( binder ):
+
+    sql , columns = binder.compiled_statement( 'insert' , ( 'name' , 'contract_start_date' ) )
+    binder.connection.execute( sql , [ 'Acme' , '2024-01-05' ] )
+    binder.connection.execute( sql , [ 'Nobody' , '' ] )
+
+    assert stored_dates( binder ) == [ '2024-01-05' , None ]
+
+
+def test_update_round_trips_date( binder ):
+
+    binder.connection.execute( "insert into customers ( name , contract_start_date ) values ( 'Acme' , '2020-02-02' )" )
+    sql , columns = binder.compiled_statement( 'update' , ( 'contract_start_date' , ) )
+    binder.connection.execute( sql , [ '2024-01-05' , 1 ] )
+
+    assert stored_dates( binder ) == [ '2024-01-05' ]
+
+
+def test_multi_row_insert_round_trips_date( binder ):
+
+    sql = binder.multi_row_insert_sql( ( 'name' , 'contract_start_date' ) , 2 )
+    binder.connection.execute( sql , [ 'Acme' , '2024-01-05' , 'Initech' , '1999-02-19' ] )
+
+    assert stored_dates( binder ) == [ '2024-01-05' , '1999-02-19' ]